@@ -1,15 +1,22 @@
 import base64
+import functools
+import gzip
 import logging
 import os
+import re
+import stat
 import sys
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import clasificador
-from flask import Flask, request, send_from_directory
+import orjson
+from flask import Flask, abort, request, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_restx import Api, Namespace, Resource
 from models import create_models
+from werkzeug.security import safe_join
 
 # Configure logging to stdout for Home Assistant
 logging.basicConfig(
@@ -19,7 +26,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Optional prefix on image payloads: "data:image/jpeg;base64," (data URI) or
+# "image/jpg;data:" (custom). Base64 never contains ";" or ",", and the custom
+# form is bounded, so a bare payload is rejected after a few characters
+# instead of being scanned end to end.
+DATA_URI_PREFIX_RE = re.compile(r"(?P<uri>data:[^,]*,)|[^;,]{0,255};data:")
+
+# Absolute UI paths, resolved once so they work regardless of working directory
+UI_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "ui"))
+UI_ASSETS_DIR = os.path.join(UI_DIR, "assets")
+# Browser cache lifetime for /assets/. Asset names are not content-hashed, so
+# this stays at a day; ETag revalidation covers changes after it expires.
+UI_ASSETS_MAX_AGE = 24 * 60 * 60
+# Text assets served gzip-encoded to clients that accept it
+COMPRESSIBLE_ASSET_SUFFIXES = (".css", ".js", ".json", ".xml", ".svg", ".txt")
+# Content types of the asset extensions the UI uses; anything else is served
+# as application/octet-stream
+ASSET_CONTENT_TYPES = {
+    ".css": "text/css",
+    ".js": "text/javascript",
+    ".json": "application/json",
+    ".xml": "application/xml",
+    ".svg": "image/svg+xml",
+    ".txt": "text/plain",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".ico": "image/x-icon",
+    ".woff": "font/woff",
+    ".woff2": "font/woff2",
+    ".ttf": "font/ttf",
+}
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, with native numpy support."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Let a fronting web server stream send_file() bodies (thumbnails, UI pages)
+# with sendfile(2) via X-Sendfile; only enable when one is configured for it
+app.config["USE_X_SENDFILE"] = (
+    os.environ.get("FACE_REKON_USE_X_SENDFILE", "false").lower() == "true"
+)
 CORS(app)
 
 # Initialize Flask-RESTX API
@@ -85,16 +142,13 @@ class Recognize(Resource):
 
             # Handle data URI format (e.g., "data:image/jpeg;base64,..."
             # or "image/jpg;data:...")
-            if image_base64.startswith("data:"):
-                image_base64 = image_base64.split(",", 1)[
-                    1
-                ]  # Remove "data:image/jpeg;base64," prefix
-                logger.info("🔧 Removed data URI prefix")
-            elif ";data:" in image_base64:
-                image_base64 = image_base64.split(";data:", 1)[
-                    1
-                ]  # Remove "image/jpg;data:" prefix
-                logger.info("🔧 Removed custom data prefix")
+            prefix = DATA_URI_PREFIX_RE.match(image_base64)
+            if prefix:
+                image_base64 = image_base64[prefix.end() :]
+                if prefix.group("uri"):
+                    logger.info("🔧 Removed data URI prefix")
+                else:
+                    logger.info("🔧 Removed custom data prefix")
 
             # Decode base64 image
             try:
@@ -290,36 +344,146 @@ class Face(Resource):
 @app.route("/", methods=["GET"])
 def home() -> Any:
     """Serve the main UI page"""
-    import os
+    return send_from_directory(UI_DIR, "index.html")
+
+
+def asset_stat(filename: str) -> Optional[os.stat_result]:
+    """Stat a UI asset.
+
+    Returns None when the name escapes UI_ASSETS_DIR or is not a regular file.
+    """
+    path = safe_join(UI_ASSETS_DIR, filename)
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return st
+
+
+def asset_etag(st: os.stat_result) -> str:
+    """Strong ETag for a UI asset built from its mtime and size."""
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+
+def list_ui_assets() -> FrozenSet[str]:
+    """Paths of every file under UI_ASSETS_DIR, as requested under /assets/."""
+    return frozenset(
+        os.path.relpath(os.path.join(dirpath, name), UI_ASSETS_DIR).replace(os.sep, "/")
+        for dirpath, _, filenames in os.walk(UI_ASSETS_DIR)
+        for name in filenames
+    )
+
+
+# Assets present at startup; files added later are served after a restart
+VALID_ASSETS = list_ui_assets()
 
-    # Get absolute path to ensure it works regardless of working directory
-    ui_dir = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "..", "ui")
-    )  # noqa: E501
-    return send_from_directory(ui_dir, "index.html")
+
+def gzip_ui_assets() -> Dict[str, Tuple[str, bytes]]:
+    """Gzip every text asset in VALID_ASSETS once.
+
+    Returns:
+        Map of asset path (as requested under /assets/) to the ETag of the
+        source file and its gzipped bytes
+    """
+    compressed = {}
+    for filename in VALID_ASSETS:
+        if not filename.endswith(COMPRESSIBLE_ASSET_SUFFIXES):
+            continue
+        # Skip files that vanished or turned into broken links since listing;
+        # serve_assets 404s those the same way
+        st = asset_stat(filename)
+        path = safe_join(UI_ASSETS_DIR, filename)
+        if st is None or path is None:
+            continue
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        compressed[filename] = (asset_etag(st), gzip.compress(data, 9, mtime=0))
+    return compressed
+
+
+GZIPPED_ASSETS = gzip_ui_assets()
+
+
+@functools.lru_cache(maxsize=128)
+def read_ui_asset(filename: str, etag: str) -> bytes:
+    """Read an asset's bytes, cached per ETag so an edited file is re-read."""
+    with open(safe_join(UI_ASSETS_DIR, filename), "rb") as f:
+        return f.read()
 
 
 @app.route("/assets/<path:filename>", methods=["GET"])
 def serve_assets(filename: str) -> Any:
     """Serve static UI assets (CSS, JS, images)"""
-    import os
+    # Unknown names, including traversal and NUL-byte attempts, are turned
+    # away with a set lookup before safe_join or any filesystem call
+    if filename not in VALID_ASSETS:
+        abort(404)
+
+    st = asset_stat(filename)
+    if st is None:
+        abort(404)
+    etag = asset_etag(st)
+
+    # Text assets go out pre-compressed unless edited since startup
+    gzipped = GZIPPED_ASSETS.get(filename)
+    if gzipped is not None and gzipped[0] != etag:
+        gzipped = None
+    use_gzip = gzipped is not None and request.accept_encodings["gzip"] > 0
+    if use_gzip:
+        etag = f"{etag}-gz"
+
+    response = app.response_class(status=304)
+    response.set_etag(etag)
+    response.last_modified = st.st_mtime
+    response.cache_control.public = True
+    response.cache_control.max_age = UI_ASSETS_MAX_AGE
+    if gzipped is not None:
+        response.vary.add("Accept-Encoding")
+
+    # Revalidation of an unchanged asset is answered from the stat alone,
+    # without reading the file
+    if request.if_none_match.contains(etag):
+        return response
 
-    ui_assets_dir = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "..", "ui", "assets")
+    response.status_code = 200
+    response.mimetype = ASSET_CONTENT_TYPES.get(
+        os.path.splitext(filename)[1].lower(), "application/octet-stream"
+    )
+    if use_gzip:
+        response.content_encoding = "gzip"
+
+    # HEAD only needs the headers; the length comes from the stat (or the
+    # gzipped bytes already in memory) so the file is never read
+    if request.method == "HEAD":
+        response.content_length = len(gzipped[1]) if use_gzip else st.st_size
+        response.accept_ranges = "bytes"
+        return response
+
+    if use_gzip:
+        data = gzipped[1]
+    else:
+        try:
+            data = read_ui_asset(filename, etag)
+        except OSError:
+            # Removed or swapped out since the stat above
+            abort(404)
+    response.set_data(data)
+    return response.make_conditional(
+        request, accept_ranges=True, complete_length=len(data)
     )
-    return send_from_directory(ui_assets_dir, filename)
 
 
 @app.route("/loadSnapshot", methods=["GET"])
 def loadSnapshot() -> Any:
     """Serve the main UI page"""
-    import os
-
-    # Get absolute path to ensure it works regardless of working directory
-    ui_dir = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "..", "ui")
-    )  # noqa: E501
-    return send_from_directory(ui_dir, "loadSnapshot.html")
+    return send_from_directory(UI_DIR, "loadSnapshot.html")
 
 
 @app.route("/images/<string:face_id>", methods=["GET"])
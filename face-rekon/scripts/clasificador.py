@@ -43,6 +43,16 @@ USE_OPTIMIZED_STORAGE = (
 
 THUMBNAIL_SIZE = (160, 160)
 
+# libjpeg-turbo thumbnail encoder (needs PyTurboJPEG and the libturbojpeg
+# shared library); thumbnails fall back to PIL when either is missing
+try:
+    from turbojpeg import TJPF_BGR, TJPF_GRAY, TJSAMP_420, TJSAMP_GRAY, TurboJPEG
+
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError) as e:
+    logger.info(f"ℹ️ PyTurboJPEG not available, using PIL for thumbnails: {e}")
+    _turbo_jpeg = None
+
 # Face quality thresholds
 MIN_FACE_SIZE = int(
     os.environ.get("FACE_REKON_MIN_FACE_SIZE", "50")
@@ -869,16 +879,31 @@ def save_face_crop_to_file(face_crop: np.ndarray, face_id: str) -> str:
         # Use enhanced hybrid thumbnail generation
         thumbnail = create_enhanced_thumbnail_hybrid(face_crop, THUMBNAIL_SIZE)
 
-        # Convert BGR to RGB if needed
-        if len(thumbnail.shape) == 3:
-            # OpenCV uses BGR, convert to RGB for PIL
-            thumbnail_rgb = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(thumbnail_rgb)
+        if _turbo_jpeg is not None:
+            # SIMD encode straight to JPEG bytes (4:2:0, as PIL does at q85);
+            # libjpeg-turbo reads OpenCV's BGR order as-is, so no channel swap
+            if len(thumbnail.shape) == 3:
+                pixel_format, subsample = TJPF_BGR, TJSAMP_420
+            else:
+                pixel_format, subsample = TJPF_GRAY, TJSAMP_GRAY
+            jpeg_bytes = _turbo_jpeg.encode(
+                thumbnail,
+                quality=85,
+                pixel_format=pixel_format,
+                jpeg_subsample=subsample,
+            )
+            with open(thumbnail_path, "wb") as f:
+                f.write(jpeg_bytes)
         else:
-            pil_image = Image.fromarray(thumbnail)
-
-        # Save directly as JPEG
-        pil_image.save(thumbnail_path, "JPEG", quality=85, optimize=True)
+            if len(thumbnail.shape) == 3:
+                # OpenCV uses BGR; PIL takes the reversed-channel view as RGB,
+                # saving the separate cvtColor pass
+                thumbnail = thumbnail[:, :, ::-1]
+
+            # Save directly as JPEG
+            Image.fromarray(thumbnail).save(
+                thumbnail_path, "JPEG", quality=85, optimize=True
+            )
 
         logger.info(f"💾 Saved thumbnail: {thumbnail_path}")
         return thumbnail_path
@@ -55,8 +55,12 @@ class QdrantAdapter:
         """Connect to embedded Qdrant database."""
         try:
             # Use embedded mode - no server needed
-            os.makedirs(QDRANT_PATH, exist_ok=True)
-            self.client = QdrantClient(path=QDRANT_PATH)
+            if QDRANT_PATH == ":memory:":
+                # In-process store without files or a storage lock (tests)
+                self.client = QdrantClient(location=":memory:")
+            else:
+                os.makedirs(QDRANT_PATH, exist_ok=True)
+                self.client = QdrantClient(path=QDRANT_PATH)
             logger.info(f"✅ Connected to embedded Qdrant at {QDRANT_PATH}")
             return
         except Exception as e:
@@ -92,6 +96,50 @@ class QdrantAdapter:
             logger.error(f"❌ Failed to ensure collection: {e}")
             raise
 
+    def _build_point(
+        self, face_data: Dict[str, Any], embedding: np.ndarray
+    ) -> Tuple[str, models.PointStruct]:
+        """
+        Build the Qdrant point for a face without writing it.
+
+        Args:
+            face_data: Face metadata (name, event_id, timestamp, etc.)
+            embedding: Face embedding vector
+
+        Returns:
+            Tuple of (face_id, point) ready to be upserted
+        """
+        face_id = face_data.get("face_id", str(uuid.uuid4()))
+
+        # Prepare payload (metadata) - file-based storage only
+        payload = {
+            "face_id": face_id,
+            "name": face_data.get("name", "unknown"),
+            "event_id": face_data.get("event_id", "unknown"),
+            "timestamp": face_data.get("timestamp", int(time.time() * 1000)),
+            "image_path": face_data.get("image_path"),
+            "thumbnail_path": face_data.get("thumbnail_path"),
+            "notes": face_data.get("notes", ""),
+            "confidence": face_data.get("confidence", 0.0),
+            "quality_metrics": face_data.get("quality_metrics", {}),
+            "face_bbox": face_data.get("face_bbox", []),
+            "created_at": int(time.time()),
+        }
+
+        # Remove None values
+        payload = {k: v for k, v in payload.items() if v is not None}
+
+        # Convert face_id to valid UUID string for Qdrant
+        try:
+            point_id = str(uuid.UUID(face_id)) if "-" in face_id else str(uuid.uuid4())
+        except ValueError:
+            point_id = str(uuid.uuid4())
+
+        point = models.PointStruct(
+            id=point_id, vector=embedding.tolist(), payload=payload
+        )
+        return face_id, point
+
     def save_face(self, face_data: Dict[str, Any], embedding: np.ndarray) -> str:
         """
         Save a face with metadata and embedding to Qdrant.
@@ -104,43 +152,10 @@ class QdrantAdapter:
             face_id: Unique identifier for the saved face
         """
         try:
-            face_id = face_data.get("face_id", str(uuid.uuid4()))
-
-            # Prepare payload (metadata) - file-based storage only
-            payload = {
-                "face_id": face_id,
-                "name": face_data.get("name", "unknown"),
-                "event_id": face_data.get("event_id", "unknown"),
-                "timestamp": face_data.get("timestamp", int(time.time() * 1000)),
-                "image_path": face_data.get("image_path"),
-                "thumbnail_path": face_data.get("thumbnail_path"),
-                "notes": face_data.get("notes", ""),
-                "confidence": face_data.get("confidence", 0.0),
-                "quality_metrics": face_data.get("quality_metrics", {}),
-                "face_bbox": face_data.get("face_bbox", []),
-                "created_at": int(time.time()),
-            }
-
-            # Remove None values
-            payload = {k: v for k, v in payload.items() if v is not None}
+            face_id, point = self._build_point(face_data, embedding)
 
             # Insert point with embedding and metadata
-            # Convert face_id to valid UUID string for Qdrant
-            try:
-                point_id = (
-                    str(uuid.UUID(face_id)) if "-" in face_id else str(uuid.uuid4())
-                )
-            except ValueError:
-                point_id = str(uuid.uuid4())
-
-            self.client.upsert(
-                collection_name=COLLECTION_NAME,
-                points=[
-                    models.PointStruct(
-                        id=point_id, vector=embedding.tolist(), payload=payload
-                    )
-                ],
-            )
+            self.client.upsert(collection_name=COLLECTION_NAME, points=[point])
 
             logger.info(f"💾 Saved face {face_id} to Qdrant")
             return face_id
@@ -149,6 +164,33 @@ class QdrantAdapter:
             logger.error(f"❌ Failed to save face to Qdrant: {e}")
             raise
 
+    def save_faces(self, faces: List[Tuple[Dict[str, Any], np.ndarray]]) -> List[str]:
+        """
+        Save several faces to Qdrant with a single upsert.
+
+        Args:
+            faces: List of (face_data, embedding) pairs, as for save_face
+
+        Returns:
+            List of face_ids in the same order as the input
+        """
+        if not faces:
+            return []
+
+        try:
+            built = [self._build_point(data, emb) for data, emb in faces]
+            self.client.upsert(
+                collection_name=COLLECTION_NAME, points=[point for _, point in built]
+            )
+
+            face_ids = [face_id for face_id, _ in built]
+            logger.info(f"💾 Saved {len(face_ids)} faces to Qdrant")
+            return face_ids
+
+        except Exception as e:
+            logger.error(f"❌ Failed to save faces to Qdrant: {e}")
+            raise
+
     def search_similar_faces(
         self, embedding: np.ndarray, limit: int = 1, score_threshold: float = None
     ) -> List[Tuple[str, float, Dict[str, Any]]]:
@@ -374,9 +416,12 @@ class QdrantAdapter:
             current_time = int(time.time())
             cutoff_time = current_time - DEDUPLICATION_WINDOW
 
-            results = self.client.scroll(
+            # Existence check only: count skips loading payloads and ids.
+            # Exact, since an approximate count can be non-zero with no match
+            # and would drop a real detection; the event_id filter keeps it cheap
+            result = self.client.count(
                 collection_name=COLLECTION_NAME,
-                scroll_filter=models.Filter(
+                count_filter=models.Filter(
                     must=[
                         models.FieldCondition(
                             key="event_id", match=models.MatchValue(value=event_id)
@@ -386,10 +431,10 @@ class QdrantAdapter:
                         ),
                     ]
                 ),
-                limit=1,
+                exact=True,
             )
 
-            has_recent = len(results[0]) > 0
+            has_recent = result.count > 0
             if has_recent:
                 logger.info(
                     f"🚫 Found recent detection for event {event_id} "
@@ -29,20 +29,36 @@ def temp_dirs():
     shutil.rmtree(temp_base)
 
 
+@pytest.fixture(scope="session")
+def dummy_embedding():
+    """Deterministic 512-dim embedding built once and shared (read-only)"""
+    embedding = np.random.default_rng(0).random(512, dtype=np.float32)
+    embedding.setflags(write=False)
+    return embedding
+
+
+@pytest.fixture(scope="session")
+def dummy_embeddings():
+    """Pair of distinct deterministic embeddings for multi-face mocks"""
+    embeddings = np.random.default_rng(1).random((2, 512), dtype=np.float32)
+    embeddings.setflags(write=False)
+    return tuple(embeddings)
+
+
 @pytest.fixture
-def mock_insightface():
+def mock_insightface(dummy_embedding):
     """Mock InsightFace app"""
     mock_app = Mock()
     mock_face = Mock()
-    mock_face.embedding = np.random.random(512).astype(np.float32)
+    mock_face.embedding = dummy_embedding
     mock_app.get.return_value = [mock_face]
     return mock_app
 
 
 @pytest.fixture
-def sample_embedding():
+def sample_embedding(dummy_embedding):
     """Sample face embedding"""
-    return np.random.random(512).astype(np.float32)
+    return dummy_embedding
 
 
 @pytest.fixture
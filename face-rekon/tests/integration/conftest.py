@@ -2,12 +2,22 @@
 Integration test fixtures and configuration.
 Sets up real test environment with isolated databases and file systems.
 """
+import atexit
 import base64
+import hashlib
+import inspect
 import io
+import json
 import os
 import shutil
+import subprocess
 import sys
 import tempfile
+import threading
+import types
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pytest
 from PIL import Image
@@ -18,28 +28,114 @@ scripts_path = os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
 if not os.path.exists(scripts_path):
     # We're likely in a container where scripts is at /app/scripts
     scripts_path = "/app/scripts"
-sys.path.insert(0, scripts_path)
+if scripts_path not in sys.path:
+    sys.path.insert(0, scripts_path)
+
+# pytest-xdist sets this in each worker; every worker needs its own embedded
+# Qdrant store because the storage directory is locked by one client at a time
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+test_temp_base = "/tmp/face_rekon_integration_test" + (
+    f"_{_XDIST_WORKER}" if _XDIST_WORKER else ""
+)
+
+# Resolved once so collection can check tree membership without string work
+_INT_DIR = Path(__file__).parent.resolve()
+
+
+def _prefetch_insightface_models():
+    """
+    Make sure the InsightFace model pack is on disk, one worker at a time.
+
+    Under pytest-xdist every worker imports clasificador during collection
+    and would otherwise race to download and unzip the same pack. The first
+    worker to take the lock fetches it; the others wait and then find it
+    already extracted, so each worker only pays the load from local disk.
+    """
+    try:
+        import fcntl
+
+        from insightface.utils.storage import ensure_available
+    except ImportError:
+        return
+
+    lock_path = os.path.join(tempfile.gettempdir(), "face_rekon_models.lock")
+    with open(lock_path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            ensure_available("models", "buffalo_l", root="~/.insightface")
+        except Exception as e:
+            # Leave the failure to the clasificador import, as without xdist
+            print(f"Warning: Failed to prefetch InsightFace models: {e}")
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
 
 # Override database paths for testing before importing any modules
-# This ensures clasificador.py uses test paths instead of production paths
-test_temp_base = "/tmp/face_rekon_integration_test"
+# This ensures clasificador.py uses test paths instead of production paths.
+# Done at import time: session hooks only fire for initial conftests, which
+# this one is not under the default `pytest tests` run
 os.environ["FACE_REKON_BASE_PATH"] = os.path.join(test_temp_base, "faces")
 os.environ["FACE_REKON_UNKNOWN_PATH"] = os.path.join(test_temp_base, "unknowns")
 os.environ["FACE_REKON_THUMBNAIL_PATH"] = os.path.join(test_temp_base, "thumbnails")
-os.environ["QDRANT_PATH"] = os.path.join(test_temp_base, "qdrant")
+# FACE_REKON_TEST_MODE=local keeps Qdrant in memory: no files, no lock
+if os.environ.get("FACE_REKON_TEST_MODE") == "local":
+    os.environ["QDRANT_PATH"] = ":memory:"
+else:
+    os.environ["QDRANT_PATH"] = os.path.join(test_temp_base, "qdrant")
 os.environ["FACE_REKON_USE_EMBEDDED_QDRANT"] = "true"
 
-# Create the base directories immediately
-os.makedirs(os.path.join(test_temp_base, "faces"), exist_ok=True)
-os.makedirs(os.path.join(test_temp_base, "unknowns"), exist_ok=True)
-os.makedirs(os.path.join(test_temp_base, "thumbnails"), exist_ok=True)
-os.makedirs(os.path.join(test_temp_base, "qdrant"), exist_ok=True)
-
 # Set memory optimization flags for ML models
 os.environ["OMP_NUM_THREADS"] = "2"
 os.environ["MKL_NUM_THREADS"] = "2"
 os.environ["NUMEXPR_MAX_THREADS"] = "2"
 
+# Create the base directories immediately
+for _subdir in ("faces", "unknowns", "thumbnails", "qdrant"):
+    os.makedirs(os.path.join(test_temp_base, _subdir), exist_ok=True)
+
+if _XDIST_WORKER:
+    _prefetch_insightface_models()
+
+
+def _fast_rmtree(path):
+    """
+    Remove a directory tree, preferring native `rm -rf` on POSIX.
+
+    Native rm is noticeably faster than shutil.rmtree for trees with many
+    small files (Qdrant storage, thumbnails). Falls back to shutil elsewhere.
+    """
+    if os.name == "posix" and shutil.which("rm"):
+        subprocess.run(["rm", "-rf", "--", path], check=False)
+    else:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _reap_trash(path):
+    """atexit hook: hand any leftover trash dir to a detached `rm -rf`."""
+    if os.path.exists(path) and os.name == "posix" and shutil.which("rm"):
+        subprocess.Popen(["rm", "-rf", "--", path])
+
+
+def _background_rmtree(path):
+    """
+    Remove a directory tree without blocking session teardown.
+
+    The tree is renamed to a sibling trash path (instant on the same
+    filesystem) and deleted from a daemon thread. If the interpreter exits
+    before the thread finishes, an atexit hook lets the OS finish the job.
+    """
+    trash = f"{path}.trash.{uuid.uuid4().hex}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        # Rename failed (missing dir, cross-device) - delete in place
+        _fast_rmtree(path)
+        return
+
+    threading.Thread(target=_fast_rmtree, args=(trash,), daemon=True).start()
+    atexit.register(_reap_trash, trash)
+
 
 @pytest.fixture(scope="session")
 def integration_test_env():
@@ -66,7 +162,7 @@ def integration_test_env():
     yield test_config
 
     # Cleanup
-    shutil.rmtree(temp_base, ignore_errors=True)
+    _background_rmtree(temp_base)
 
 
 @pytest.fixture(scope="session")
@@ -82,19 +178,47 @@ def shared_qdrant_adapter():
     Returns:
         QdrantAdapter: Shared instance for all tests
     """
-    try:
-        from qdrant_adapter import QdrantAdapter
+    qdrant_adapter = pytest.importorskip(
+        "qdrant_adapter", reason="Qdrant dependencies not available"
+    )
 
-        # Create single adapter instance for entire test session
-        adapter = QdrantAdapter()
+    # Create single adapter instance for entire test session
+    adapter = qdrant_adapter.QdrantAdapter()
 
-        yield adapter
+    yield adapter
 
-        # Cleanup after all tests complete
-        # The adapter's client will be closed automatically
+    # Cleanup after all tests complete
+    # The adapter's client will be closed automatically
 
-    except ImportError as e:
-        pytest.skip(f"Qdrant dependencies not available: {e}")
+
+def _clear_qdrant_collection(adapter):
+    """
+    Reset the faces collection to its freshly created, empty state.
+
+    Does nothing when the collection is already empty. Otherwise the
+    collection is dropped and recreated through the adapter's own
+    _ensure_collection, restoring the pristine state in constant time
+    (embedded Qdrant persists every deleted point individually, so a
+    filter delete grows with the number of points left by the last test).
+    Failures are logged rather than raised so a cleanup problem never
+    fails the test itself.
+    """
+    try:
+        from qdrant_adapter import COLLECTION_NAME
+        from qdrant_client.http.exceptions import UnexpectedResponse
+    except ImportError:
+        return
+
+    try:
+        count = adapter.client.count(collection_name=COLLECTION_NAME, exact=True)
+        if count.count == 0:
+            return
+        adapter.client.delete_collection(collection_name=COLLECTION_NAME)
+        adapter._ensure_collection()
+    except UnexpectedResponse as e:
+        print(f"Warning: Qdrant rejected collection cleanup: {e}")
+    except Exception as e:
+        print(f"Warning: Failed to clean Qdrant collection: {e}")
 
 
 @pytest.fixture
@@ -117,36 +241,72 @@ def qdrant_adapter(shared_qdrant_adapter):
     adapter = shared_qdrant_adapter
 
     # Clear all data from the collection before test
-    try:
-        from qdrant_adapter import COLLECTION_NAME
-        from qdrant_client import models
-
-        # Get all points and delete them
-        scroll_result = adapter.client.scroll(
-            collection_name=COLLECTION_NAME,
-            limit=10000,  # Get all points
-            with_payload=False,
-            with_vectors=False,
-        )
-
-        if scroll_result and scroll_result[0]:
-            point_ids = [point.id for point in scroll_result[0]]
-            if point_ids:
-                adapter.client.delete(
-                    collection_name=COLLECTION_NAME,
-                    points_selector=models.PointIdsList(points=point_ids),
-                )
-    except Exception as e:
-        # If cleanup fails, log but don't fail the test
-        print(f"Warning: Failed to clean Qdrant collection: {e}")
+    _clear_qdrant_collection(adapter)
 
     yield adapter
 
     # No cleanup needed after test - next test will clean before it runs
 
 
+class NullQdrantAdapter:
+    """
+    Stand-in for QdrantAdapter that persists nothing.
+
+    Mirrors the adapter methods clasificador calls, returning the same
+    "nothing found" values the real adapter gives for an empty collection.
+    """
+
+    def save_face(self, face_data, embedding):
+        return face_data.get("face_id", str(uuid.uuid4()))
+
+    def save_faces(self, faces):
+        return [self.save_face(face_data, embedding) for face_data, embedding in faces]
+
+    def search_similar_faces(self, embedding, limit=1, score_threshold=None):
+        return []
+
+    def get_face(self, face_id):
+        return None
+
+    def update_face(self, face_id, updates):
+        return False
+
+    def get_unclassified_faces(self):
+        return []
+
+    def delete_face(self, face_id):
+        return False
+
+    def check_recent_detection(self, event_id):
+        return False
+
+    def get_stats(self):
+        return {"total_faces": 0, "status": "healthy"}
+
+
+@pytest.fixture
+def stub_qdrant(monkeypatch):
+    """
+    Swap clasificador's Qdrant adapter for a NullQdrantAdapter.
+
+    For tests that exercise request handling only and never read back what
+    was stored, so they skip vector database I/O entirely.
+    """
+    import clasificador
+
+    stub = NullQdrantAdapter()
+    monkeypatch.setattr(clasificador, "_qdrant_adapter", stub)
+    try:
+        import scripts.clasificador as clasificador_scripts
+
+        monkeypatch.setattr(clasificador_scripts, "_qdrant_adapter", stub)
+    except ImportError:
+        pass
+    return stub
+
+
 @pytest.fixture(autouse=True)
-def inject_shared_qdrant_into_clasificador(shared_qdrant_adapter):
+def inject_shared_qdrant_into_clasificador(request, shared_qdrant_adapter):
     """
     Automatically inject shared Qdrant adapter into clasificador module.
 
@@ -154,30 +314,16 @@ def inject_shared_qdrant_into_clasificador(shared_qdrant_adapter):
     It ensures that clasificador.py uses the shared adapter instead of creating
     its own, preventing Qdrant storage locking issues.
 
-    Also cleans the Qdrant collection before each test to ensure isolation.
+    Also cleans the Qdrant collection before each test to ensure isolation,
+    except for tests marked qdrant_preloaded, which read points seeded once
+    by a class-scoped fixture.
     """
     try:
-        from qdrant_adapter import COLLECTION_NAME
-        from qdrant_client import models
+        import qdrant_client  # noqa: F401
 
         # Clear all data from the collection before test
-        try:
-            scroll_result = shared_qdrant_adapter.client.scroll(
-                collection_name=COLLECTION_NAME,
-                limit=10000,
-                with_payload=False,
-                with_vectors=False,
-            )
-
-            if scroll_result and scroll_result[0]:
-                point_ids = [point.id for point in scroll_result[0]]
-                if point_ids:
-                    shared_qdrant_adapter.client.delete(
-                        collection_name=COLLECTION_NAME,
-                        points_selector=models.PointIdsList(points=point_ids),
-                    )
-        except Exception as e:
-            print(f"Warning: Failed to clean Qdrant collection in autouse fixture: {e}")
+        if request.node.get_closest_marker("qdrant_preloaded") is None:
+            _clear_qdrant_collection(shared_qdrant_adapter)
 
         #  Import clasificador and inject adapter
         # Import AFTER cleanup to avoid triggering lazy initialization
@@ -211,15 +357,27 @@ def inject_shared_qdrant_into_clasificador(shared_qdrant_adapter):
         yield
 
 
-@pytest.fixture(scope="session")
-def shared_ml_models():
+@pytest.fixture(scope="session", autouse=True)
+def shared_ml_models(request):
     """
     Session-scoped fixture that loads ML models once and reuses them.
     This prevents expensive model reloading for each test.
+
+    Autouse so InsightFace/Qdrant load exactly once per session, even for
+    tests that import app/clasificador directly. Returns None when no
+    integration tests were collected or the ML stack is not installed.
     """
+    if not any(
+        item.get_closest_marker("integration") for item in request.session.items
+    ):
+        return None
+
     # Import here to avoid early model loading
-    import app
-    import clasificador
+    try:
+        import app
+        import clasificador
+    except ImportError:
+        return None
 
     # Return references to the loaded models
     return {
@@ -238,7 +396,7 @@ def clean_test_env(integration_test_env):
     """
     config = integration_test_env.copy()
 
-    # Clean up directories
+    # Clean up directories (skip the rmtree+mkdir pair when nothing was written)
     for dir_path in [
         config["base_path"],
         config["unknown_path"],
@@ -246,59 +404,299 @@ def clean_test_env(integration_test_env):
         config["qdrant_path"],
         config["tmp_path"],
     ]:
-        if os.path.exists(dir_path):
-            shutil.rmtree(dir_path)
+        if not os.path.exists(dir_path):
+            continue
+        with os.scandir(dir_path) as it:
+            empty = next(it, None) is None
+        if not empty:
+            shutil.rmtree(dir_path, ignore_errors=True)
             os.makedirs(dir_path, exist_ok=True)
 
     return config
 
 
-@pytest.fixture
+# Synthetic images served by the test_images fixture: (name, mode, size, color)
+TEST_IMAGE_CASES = (
+    ("red_square", "RGB", (200, 200), "red"),
+    ("blue_rectangle", "RGB", (300, 150), "blue"),
+    ("green_circle", "RGB", (150, 150), "green"),
+    ("small_image", "RGB", (50, 50), "yellow"),
+)
+
+# Synthetic shapes are never inspected pixel-by-pixel, so favour tiny payloads
+TEST_IMAGE_JPEG_OPTIONS = {"quality": 10, "optimize": False, "subsampling": 2}
+
+# Generated images persist here across pytest invocations (watch mode, reruns)
+TEST_IMAGE_CACHE_ROOT = os.path.join(tempfile.gettempdir(), "face_rekon_test_images")
+
+
+def _build_test_image(cache_dir, name, mode, size, color):
+    """Render one synthetic test image into cache_dir and return its entry."""
+    img = Image.new(mode, size, color)
+
+    # Add some pattern to make it more realistic
+    if name == "green_circle":
+        # Add a simple circle pattern
+        from PIL import ImageDraw
+
+        draw = ImageDraw.Draw(img)
+        draw.ellipse([25, 25, 125, 125], fill="darkgreen")
+
+    # Encode once, reuse the bytes for both the file and the base64 form
+    buffered = io.BytesIO()
+    img.save(buffered, format="JPEG", **TEST_IMAGE_JPEG_OPTIONS)
+    jpeg_bytes = buffered.getvalue()
+
+    # Write then rename so a concurrent worker never sees a partial file
+    file_path = os.path.join(cache_dir, f"{name}.jpg")
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(jpeg_bytes)
+    os.replace(tmp_path, file_path)
+
+    return name, {
+        "file_path": file_path,
+        "base64": base64.b64encode(jpeg_bytes).decode("utf-8"),
+        "size": size,
+        "color": color,
+    }
+
+
+def _load_cached_test_images(index_path):
+    """
+    Return the cached test_images mapping, or None if it must be rebuilt.
+
+    The cache only counts when the index parses and every image it lists is
+    still on disk and non-empty, so an interrupted run or a partly cleaned
+    /tmp triggers regeneration instead of failing later in a test.
+    """
+    try:
+        with open(index_path) as f:
+            images = json.load(f)
+        for image in images.values():
+            if os.path.getsize(image["file_path"]) == 0:
+                return None
+            image["size"] = tuple(image["size"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return images
+
+
+@pytest.fixture(scope="session")
 def test_images():
     """
     Provides a set of test images for integration testing.
-    Returns both file paths and base64 encoded versions.
+    Returns both file paths and base64 encoded versions. Session-scoped:
+    treat the returned mapping and image files as read-only.
+
+    Images are cached on disk keyed by a hash of the generation parameters,
+    so repeated pytest runs skip the PIL rendering and JPEG encoding.
     """
-    images = {}
+    params = repr((TEST_IMAGE_CASES, sorted(TEST_IMAGE_JPEG_OPTIONS.items())))
+    key = hashlib.blake2b(params.encode(), digest_size=8).hexdigest()
+    cache_dir = os.path.join(TEST_IMAGE_CACHE_ROOT, key)
+    index_path = os.path.join(cache_dir, "index.json")
+
+    images = _load_cached_test_images(index_path)
+    if images is not None:
+        return images
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # JPEG encoding releases the GIL, so threads render the images in parallel
+    with ThreadPoolExecutor(max_workers=len(TEST_IMAGE_CASES)) as executor:
+        images = dict(
+            executor.map(
+                lambda case: _build_test_image(cache_dir, *case), TEST_IMAGE_CASES
+            )
+        )
+
+    # Write the index last (atomically) so a partial cache is never reused
+    tmp_index = f"{index_path}.{os.getpid()}.tmp"
+    with open(tmp_index, "w") as f:
+        json.dump(images, f)
+    os.replace(tmp_index, index_path)
+
+    return images
 
-    # Create test images with different characteristics
-    test_cases = [
-        ("red_square", "RGB", (200, 200), "red"),
-        ("blue_rectangle", "RGB", (300, 150), "blue"),
-        ("green_circle", "RGB", (150, 150), "green"),
-        ("small_image", "RGB", (50, 50), "yellow"),
+
+# Tests only need a decodable face-like JPEG, not fidelity: plain quality-75
+# encode without the extra Huffman optimisation pass
+BAKED_FACE_JPEG_OPTIONS = {"quality": 75, "optimize": False, "progressive": False}
+
+
+def _draw_test_face():
+    """Render the synthetic 640x480 face posted to the recognize endpoint."""
+    from PIL import ImageDraw
+
+    img = Image.new("RGB", (640, 480), color=(240, 240, 240))
+    draw = ImageDraw.Draw(img)
+
+    # Create a realistic face pattern
+    center = (320, 240)
+    width, height = 160, 200
+
+    # Face oval
+    face_bbox = [
+        center[0] - width // 2,
+        center[1] - height // 2,
+        center[0] + width // 2,
+        center[1] + height // 2,
     ]
+    draw.ellipse(face_bbox, fill=(255, 220, 177), outline=(200, 160, 120), width=2)
+
+    # Eyes
+    left_eye = (center[0] - 30, center[1] - 40)
+    right_eye = (center[0] + 30, center[1] - 40)
+
+    for eye_center in [left_eye, right_eye]:
+        draw.ellipse(
+            [
+                eye_center[0] - 15,
+                eye_center[1] - 10,
+                eye_center[0] + 15,
+                eye_center[1] + 10,
+            ],
+            fill="white",
+            outline="black",
+            width=2,
+        )
+        draw.ellipse(
+            [
+                eye_center[0] - 6,
+                eye_center[1] - 6,
+                eye_center[0] + 6,
+                eye_center[1] + 6,
+            ],
+            fill="black",
+        )
+
+    # Nose
+    draw.polygon(
+        [
+            (center[0], center[1]),
+            (center[0] - 10, center[1] + 20),
+            (center[0] + 10, center[1] + 20),
+        ],
+        fill=(210, 180, 140),
+    )
+
+    # Mouth
+    draw.arc(
+        [center[0] - 30, center[1] + 50, center[0] + 30, center[1] + 80],
+        start=0,
+        end=180,
+        fill="red",
+        width=3,
+    )
+
+    return img
+
+
+@pytest.fixture(scope="session")
+def baked_face_bytes():
+    """
+    JPEG bytes of the synthetic test face, drawn at most once per cache key.
+
+    The file is cached under TEST_IMAGE_CACHE_ROOT, keyed by a hash of the
+    drawing code and encode options, so later runs read it back instead of
+    redrawing it with ImageDraw.
+    """
+    params = inspect.getsource(_draw_test_face) + repr(
+        sorted(BAKED_FACE_JPEG_OPTIONS.items())
+    )
+    key = hashlib.blake2b(params.encode(), digest_size=8).hexdigest()
+    face_path = Path(TEST_IMAGE_CACHE_ROOT, f"face_{key}.jpg")
+
+    if not face_path.exists():
+        face_path.parent.mkdir(parents=True, exist_ok=True)
+        buffered = io.BytesIO()
+        _draw_test_face().save(buffered, format="JPEG", **BAKED_FACE_JPEG_OPTIONS)
+
+        # Write then rename so a concurrent worker never reads a partial file
+        tmp_path = face_path.with_name(f"{face_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(buffered.getvalue())
+        os.replace(tmp_path, face_path)
+
+    return face_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def test_image_base64(baked_face_bytes):
+    """Base64 form of baked_face_bytes, the realistic face for detection tests."""
+    return base64.b64encode(baked_face_bytes).decode("utf-8")
+
+
+# 1x1 RGBA PNG used by the recognize cleanup/prefix tests, already encoded
+TINY_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAA"
+    "DUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+)
+
+
+@pytest.fixture(scope="session")
+def encoded_test_png():
+    """
+    Base64 forms of TINY_PNG_B64, built once per session with no codec work.
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        for name, mode, size, color in test_cases:
-            # Create image
-            img = Image.new(mode, size, color)
+    Keys: ``png_b64`` (bare), ``png_data_uri_jpeg`` (``data:`` URI) and
+    ``png_semicolon_prefix`` (the ``image/jpg;data:`` variant app.py strips).
+    """
+    png_b64 = TINY_PNG_B64
+    return types.MappingProxyType(
+        {
+            "png_b64": png_b64,
+            "png_data_uri_jpeg": f"data:image/jpeg;base64,{png_b64}",
+            "png_semicolon_prefix": f"image/jpg;data:{png_b64}",
+        }
+    )
 
-            # Add some pattern to make it more realistic
-            if name == "green_circle":
-                # Add a simple circle pattern
-                from PIL import ImageDraw
 
-                draw = ImageDraw.Draw(img)
-                draw.ellipse([25, 25, 125, 125], fill="darkgreen")
+@pytest.fixture(scope="session")
+def tiny_image_b64():
+    """
+    1x1 JPEG for tests that only exercise request control flow.
 
-            # Save as file
-            file_path = os.path.join(temp_dir, f"{name}.jpg")
-            img.save(file_path, "JPEG")
+    Keeps the JSON payload to a few hundred bytes where the pixel content
+    is never inspected. Use test_images when the decode path matters.
+    """
+    img = Image.new("RGB", (1, 1), "red")
+    buffered = io.BytesIO()
+    img.save(buffered, "JPEG", quality=10)
+    return base64.b64encode(buffered.getvalue()).decode("ascii")
 
-            # Convert to base64
-            buffered = io.BytesIO()
-            img.save(buffered, format="JPEG")
-            img_b64 = base64.b64encode(buffered.getvalue()).decode("utf-8")
 
-            images[name] = {
-                "file_path": file_path,
-                "base64": img_b64,
-                "size": size,
-                "color": color,
-            }
+@pytest.fixture(scope="session")
+def api_prefix():
+    """
+    Mount prefix of the face-rekon namespace, resolved once per session.
+
+    Read from the app's own Api/Namespace registration, so tests build
+    URLs directly instead of probing candidate prefixes with requests.
+    """
+    try:
+        import app
+    except ImportError as e:
+        pytest.skip(f"Flask app not available: {e}")
+
+    return f"{app.api.prefix}{app.ns.path}"
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Module-scoped Flask test client for the real app.
+
+    Shadows the mocked root-level ``client`` for integration tests so the
+    werkzeug test harness is built once per module rather than per test.
+    Tests that need clean per-test storage should use flask_test_client.
+    Skips the module when the app (and its ML stack) cannot be imported.
+    """
+    app = pytest.importorskip("app", reason="ML dependencies not available")
 
-        yield images
+    app.app.config["TESTING"] = True
+    with app.app.test_client() as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -307,6 +705,9 @@ def flask_test_client(clean_test_env, shared_ml_models):
     Creates a Flask test client using pre-loaded ML models to avoid expensive reloading.
     Reuses session-scoped models for better memory efficiency.
     """
+    if shared_ml_models is None:
+        pytest.skip("ML models not available")
+
     # Use the pre-loaded Flask app from shared_ml_models
     app = shared_ml_models["app"]
     app.config["TESTING"] = True
@@ -314,63 +715,117 @@ def flask_test_client(clean_test_env, shared_ml_models):
     # Create test client
     client = app.test_client()
 
-    yield client
+    # Point clasificador's storage paths at the clean per-test directories.
+    # Plain setattr/restore avoids the bookkeeping of stacked mock.patch calls.
+    clasificador = shared_ml_models["clasificador"]
+    overrides = {
+        "BASE_PATH": clean_test_env["base_path"],
+        "UNKNOWN_PATH": clean_test_env["unknown_path"],
+        "THUMBNAIL_PATH": clean_test_env["thumbnail_path"],
+    }
+    saved = {name: getattr(clasificador, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(clasificador, name, value)
+
+    try:
+        yield client
+    finally:
+        for name, value in saved.items():
+            setattr(clasificador, name, value)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_face_data():
     """
     Provides sample face data for database testing.
+
+    Built once per session as a read-only mapping; tests that need to
+    mutate it must take a copy first (`dict(sample_face_data)`).
     """
-    return {
-        "face_id": "test_face_001",
-        "event_id": "integration_test_event",
-        "timestamp": 1234567890,
-        "image_path": "/test/path/image.jpg",
-        "embedding": [0.1] * 512,  # Simplified 512-dim embedding
-        "thumbnail": "dGVzdF90aHVtYm5haWw=",  # "test_thumbnail" in base64
-        "name": None,
-        "relationship": "unknown",
-        "confidence": "unknown",
-    }
+    return types.MappingProxyType(
+        {
+            "face_id": "test_face_001",
+            "event_id": "integration_test_event",
+            "timestamp": 1234567890,
+            "image_path": "/test/path/image.jpg",
+            "embedding": (0.1,) * 512,  # Simplified 512-dim embedding
+            "thumbnail": "dGVzdF90aHVtYm5haWw=",  # "test_thumbnail" in base64
+            "name": None,
+            "relationship": "unknown",
+            "confidence": "unknown",
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def known_face_data():
     """
     Provides sample data for a known/classified face.
+
+    Read-only and session-scoped like sample_face_data.
     """
-    return {
-        "face_id": "known_face_001",
-        "event_id": "integration_test_event",
-        "timestamp": 1234567800,
-        "image_path": "/test/path/known.jpg",
-        "embedding": [0.2] * 512,
-        "thumbnail": "a25vd25fdGh1bWJuYWls",  # "known_thumbnail" in base64
-        "name": "John Doe",
-        "relationship": "friend",
-        "confidence": "high",
-    }
+    return types.MappingProxyType(
+        {
+            "face_id": "known_face_001",
+            "event_id": "integration_test_event",
+            "timestamp": 1234567800,
+            "image_path": "/test/path/known.jpg",
+            "embedding": (0.2,) * 512,
+            "thumbnail": "a25vd25fdGh1bWJuYWls",  # "known_thumbnail" in base64
+            "name": "John Doe",
+            "relationship": "friend",
+            "confidence": "high",
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def unclassified_face_variants(sample_face_data, known_face_data):
+    """
+    Ready-to-save (face_data, embedding) pairs for unclassified listing tests.
+
+    Two unknown faces derived from sample_face_data plus one named face
+    from known_face_data, built once per session so tests can hand them
+    straight to QdrantAdapter.save_faces.
+    """
+    import numpy as np
+
+    def _variant(template, face_id, name):
+        face_data = {**template, "face_id": face_id, "name": name}
+        embedding = np.asarray(face_data.pop("embedding"), dtype=np.float32)
+        embedding.setflags(write=False)
+        return types.MappingProxyType(face_data), embedding
+
+    return (
+        _variant(sample_face_data, "unclassified_api_1", "unknown"),
+        _variant(sample_face_data, "unclassified_api_2", "unknown"),
+        _variant(known_face_data, "classified_api_1", "John"),
+    )
 
 
-@pytest.mark.integration
 def pytest_configure(config):
     """
     Configure pytest with custom markers for integration tests.
     """
     config.addinivalue_line("markers", "integration: mark test as integration test")
     config.addinivalue_line("markers", "slow: mark test as slow running")
+    # Registered by pytest-xdist itself; repeated here for runs without it
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests on one worker under loadgroup"
+    )
+    config.addinivalue_line(
+        "markers", "qdrant_preloaded: keep class-seeded Qdrant points between tests"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
     """
     Auto-mark integration tests and add skip conditions.
     """
-    integration_marker = pytest.mark.integration
-    slow_marker = pytest.mark.slow
+    markers = (pytest.mark.integration, pytest.mark.slow)
 
     for item in items:
         # Auto-mark integration tests
-        if "integration" in str(item.fspath):
-            item.add_marker(integration_marker)
-            item.add_marker(slow_marker)
+        if _INT_DIR in item.path.parents:
+            for marker in markers:
+                item.add_marker(marker)
@@ -9,129 +9,103 @@ This test file covers previously uncovered lines in app.py:
 - Lines 389-390: Main entry point with debug mode configuration
 """
 
-import base64
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import app
+import pytest
+
+# These tests check request handling only; none reads back stored faces
+pytestmark = pytest.mark.usefixtures("stub_qdrant")
 
 
 class TestPingEndpoint:
     """Tests for the /ping endpoint (line 55)."""
 
-    def test_ping_returns_pong(self):
+    def test_ping_returns_pong(self, client):
         """Test /ping endpoint returns {"pong": True} - covers line 55."""
-        import app
-
-        with app.app.test_client() as client:
-            response = client.get("/api/face-rekon/ping")
-            assert response.status_code == 200
-            data = response.get_json()
-            assert data == {"pong": True}
-            print("✅ Ping endpoint test passed")
+        response = client.get("/api/face-rekon/ping")
+        assert response.status_code == 200
+        # Flask-RESTX's JSON output is stable, so compare bytes without parsing
+        assert response.data == b'{"pong": true}\n'
 
 
 class TestRecognizeCleanup:
     """Tests for /recognize cleanup exception handler."""
 
-    def test_recognize_cleanup_exception(self):
+    def test_recognize_cleanup_exception(self, client, encoded_test_png):
         """Test /recognize cleanup fails - covers lines 240-241."""
-        import app
-
-        with app.app.test_client() as client:
-            # Create a valid test image
-            test_image_bytes = base64.b64decode(
-                "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAA"
-                "DUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+        image_base64 = encoded_test_png["png_b64"]
+
+        # Mock os.remove to raise an exception during cleanup
+        with patch("os.remove") as mock_remove:
+            mock_remove.side_effect = OSError("Permission denied")
+
+            response = client.post(
+                "/api/face-rekon/recognize",
+                json={
+                    "image_base64": image_base64,
+                    "event_id": "test_cleanup_error",
+                },
             )
-            image_base64 = base64.b64encode(test_image_bytes).decode()
 
-            # Mock os.remove to raise an exception during cleanup
-            with patch("os.remove") as mock_remove:
-                mock_remove.side_effect = OSError("Permission denied")
-
-                response = client.post(
-                    "/api/face-rekon/recognize",
-                    json={
-                        "image_base64": image_base64,
-                        "event_id": "test_cleanup_error",
-                    },
-                    content_type="application/json",
-                )
-
-                # Request should still complete (cleanup error is caught)
-                assert response.status_code in [200, 500]
-                # os.remove should have been called and raised exception
-                assert mock_remove.called
-                print("✅ Cleanup exception handler test passed")
+            # Request should still complete (cleanup error is caught)
+            assert response.status_code in [200, 500]
+            # os.remove should have been called and raised exception
+            assert mock_remove.called
 
 
 class TestUnclassifiedFacesEndpoint:
     """Tests for the /face-rekon/ GET endpoint."""
 
-    def test_get_unclassified_faces(self):
+    def test_get_unclassified_faces(self, client):
         """Test GET /face-rekon/ - covers lines 255-256."""
-        import app
-
-        with app.app.test_client() as client:
-            response = client.get("/api/face-rekon/")
-            assert response.status_code == 200
-            data = response.get_json()
-            # Should return a list (may be empty)
-            assert isinstance(data, list)
-            print("✅ Get unclassified faces test passed")
+        response = client.get("/api/face-rekon/")
+        assert response.status_code == 200
+        data = response.get_json()
+        # Should return a list (may be empty)
+        assert isinstance(data, list)
 
 
 class TestSpecificFaceEndpoint:
     """Tests for the /face-rekon/<face_id> GET endpoint."""
 
-    def test_get_specific_face(self):
+    def test_get_specific_face(self, client):
         """Test GET /face-rekon/<face_id> - covers lines 268-269."""
-        import app
-
-        with app.app.test_client() as client:
-            # Try to get a face (may not exist, which is fine)
-            response = client.get("/api/face-rekon/nonexistent_face_id")
-            # 200 with None or 404, both are valid
-            assert response.status_code in [200, 404]
-            print("✅ Get specific face test passed")
+        # Try to get a face (may not exist, which is fine)
+        response = client.get("/api/face-rekon/nonexistent_face_id")
+        # 200 with None or 404, both are valid
+        assert response.status_code in [200, 404]
 
 
 class TestMainEntryPoint:
     """Tests for the if __name__ == '__main__' block."""
 
-    def test_main_entry_point_debug_mode_true(self):
+    @pytest.fixture
+    def mocked_run(self, monkeypatch):
+        """Replace app.run with a MagicMock to prevent actual server start."""
+        mock_run = MagicMock()
+        monkeypatch.setattr(app.app, "run", mock_run)
+        return mock_run
+
+    def test_main_entry_point_debug_mode_true(self, monkeypatch, mocked_run):
         """Test main entry with FLASK_DEBUG=true - covers lines 389-390."""
-        import app
-
-        # Mock os.environ to set FLASK_DEBUG=true
-        with patch.dict(os.environ, {"FLASK_DEBUG": "true"}):
-            # Mock app.run to prevent actual server start
-            with patch.object(app.app, "run") as mock_run:
-                # Execute the if __name__ == "__main__" block manually
-                if True:  # Simulate __name__ == "__main__"
-                    debug_mode = (
-                        os.environ.get("FLASK_DEBUG", "false").lower() == "true"
-                    )
-                    app.app.run(host="0.0.0.0", port=5001, debug=debug_mode)
-
-                # Verify run was called with debug=True
-                mock_run.assert_called_once_with(host="0.0.0.0", port=5001, debug=True)
-                print("✅ Main entry point (debug=true) test passed")
-
-    def test_main_entry_point_debug_mode_false(self):
+        monkeypatch.setenv("FLASK_DEBUG", "true")
+
+        # Execute the if __name__ == "__main__" block manually
+        debug_mode = os.environ.get("FLASK_DEBUG", "false").lower() == "true"
+        app.app.run(host="0.0.0.0", port=5001, debug=debug_mode)
+
+        # Verify run was called with debug=True
+        mocked_run.assert_called_once_with(host="0.0.0.0", port=5001, debug=True)
+
+    def test_main_entry_point_debug_mode_false(self, monkeypatch, mocked_run):
         """Test main entry with FLASK_DEBUG=false - covers lines 389-390."""
-        import app
-
-        # Mock os.environ to set FLASK_DEBUG=false
-        with patch.dict(os.environ, {"FLASK_DEBUG": "false"}):
-            # Mock app.run to prevent actual server start
-            with patch.object(app.app, "run") as mock_run:
-                # Execute the if __name__ == "__main__" block manually
-                if True:  # Simulate __name__ == "__main__"
-                    debug_mode = (
-                        os.environ.get("FLASK_DEBUG", "false").lower() == "true"
-                    )
-                    app.app.run(host="0.0.0.0", port=5001, debug=debug_mode)
-
-                # Verify run was called with debug=False
-                mock_run.assert_called_once_with(host="0.0.0.0", port=5001, debug=False)
-                print("✅ Main entry point (debug=false) test passed")
+        monkeypatch.setenv("FLASK_DEBUG", "false")
+
+        # Execute the if __name__ == "__main__" block manually
+        debug_mode = os.environ.get("FLASK_DEBUG", "false").lower() == "true"
+        app.app.run(host="0.0.0.0", port=5001, debug=debug_mode)
+
+        # Verify run was called with debug=False
+        mocked_run.assert_called_once_with(host="0.0.0.0", port=5001, debug=False)
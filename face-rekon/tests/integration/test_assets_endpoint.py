@@ -9,352 +9,389 @@ Testing approach:
 - Uses Docker environment where ML dependencies are available
 - Tests all error conditions without mocking core functionality
 - Follows existing integration test patterns for consistency
-- Covers lines 308-313 in app.py (serve_assets function)
+- Covers the serve_assets function in app.py
 """
 
-from unittest import TestCase
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-
-class TestAssetsEndpointCoverage(TestCase):
+# Import the app - will work in Docker, may fail locally
+try:
+    import app
+
+    ML_AVAILABLE = True
+except ImportError:
+    ML_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(
+    not ML_AVAILABLE, reason="ML dependencies not available"
+)
+
+# Statuses for an asset that may or may not exist, and for any handled request
+_SERVED_OR_MISSING = frozenset({200, 404})
+_HANDLED_STATUSES = frozenset({200, 404, 500})
+
+# Substring expected in the Content-Type of each asset extension
+_EXPECTED_CONTENT_TYPES = {
+    ".css": "text/css",
+    ".js": "javascript",
+    ".json": "json",
+    ".xml": "xml",
+    ".txt": "text/plain",
+    ".png": "image",
+    ".jpg": "image",
+    ".gif": "image",
+    ".ico": "image",
+    ".woff": "font",
+    ".ttf": "font",
+}
+
+
+def _assert_content_type(asset, content_type):
+    """Assert content_type matches the asset's extension, if one is expected."""
+    expected = _EXPECTED_CONTENT_TYPES.get(os.path.splitext(asset)[1])
+    assert expected is None or expected in content_type.lower()
+
+
+class TestAssetsEndpointCoverage:
     """Docker integration tests for assets endpoint with real environment."""
 
-    def test_assets_successful_file_serving(self):
+    def test_assets_successful_file_serving(self, client):
         """Test successful asset file serving functionality."""
-        try:
-            import app
-
-            with app.app.test_client() as client:
-                # Test various asset file types that might exist
-                asset_files = [
-                    "style.css",
-                    "app.js",
-                    "main.css",
-                    "script.js",
-                    "favicon.ico",
-                    "logo.png",
-                    "background.jpg",
-                ]
-
-                for asset_file in asset_files:
-                    response = client.get(f"/assets/{asset_file}")
-
-                    # Should return 200 if file exists, or 404 if not found
-                    assert response.status_code in [200, 404]
-
-                    if response.status_code == 200:
-                        # Test successful file serving
-                        assert len(response.data) > 0
-                        print(f"✅ Successfully served asset: {asset_file}")
-
-                        # Test appropriate content types for different files
-                        content_type = response.content_type
-                        if asset_file.endswith(".css"):
-                            assert "text/css" in content_type
-                        elif asset_file.endswith(".js"):
-                            assert "javascript" in content_type.lower()
-                        elif asset_file.endswith((".png", ".jpg", ".ico")):
-                            assert "image" in content_type.lower()
-
-                        print(
-                            f"✅ Correct content type for {asset_file}: {content_type}"
-                        )
-
-                    elif response.status_code == 404:
-                        # Test file not found scenario (expected in test environment)
-                        print(f"✅ Asset not found handled correctly: {asset_file}")
-
-        except ImportError as e:
-            pytest.skip(f"ML dependencies not available: {e}")
-
-    def test_assets_directory_resolution_logic(self):
+        if not os.path.isdir(app.UI_ASSETS_DIR):
+            pytest.skip("no assets dir")
+
+        # Test various asset file types that might exist
+        asset_files = [
+            "style.css",
+            "app.js",
+            "main.css",
+            "script.js",
+            "favicon.ico",
+            "logo.png",
+            "background.jpg",
+        ]
+
+        for asset_file in asset_files:
+            response = client.get(f"/assets/{asset_file}")
+
+            # Should return 200 if file exists, or 404 if not found
+            assert response.status_code in _SERVED_OR_MISSING
+
+            if response.status_code == 200:
+                # Test successful file serving
+                assert len(response.data) > 0
+
+                # Test appropriate content types for different files
+                _assert_content_type(asset_file, response.content_type)
+
+    def test_assets_directory_resolution_logic(self, client):
         """Test the directory resolution logic in serve_assets function."""
-        try:
-            import app
-
-            with app.app.test_client() as client:
-                # Test the endpoint to trigger directory resolution logic
-                # This ensures lines 308, 310-311 are executed
-                response = client.get("/assets/test-file.css")
-
-                # The function should execute os.path.abspath and os.path.join logic
-                # regardless of whether file exists or not
-                assert response.status_code in [200, 404, 500]
-
-                print(f"✅ Directory resolution logic executed: {response.status_code}")
+        # Test the endpoint to trigger directory resolution logic
+        # This ensures lines 308, 310-311 are executed
+        response = client.get("/assets/test-file.css")
 
-                # Test that the endpoint is properly routed
-                # This ensures the @app.route decorator and function definition work
-                assert response.status_code != 405  # Method not allowed
-                print("✅ Route properly configured for GET method")
+        # The function should execute os.path.abspath and os.path.join logic
+        # regardless of whether file exists or not
+        assert response.status_code in _HANDLED_STATUSES
 
-        except ImportError as e:
-            pytest.skip(f"ML dependencies not available: {e}")
+        # Test that the endpoint is properly routed
+        # This ensures the @app.route decorator and function definition work
+        assert response.status_code != 405  # Method not allowed
 
-    def test_assets_path_construction_coverage(self):
+    def test_assets_path_construction_coverage(self, client):
         """Test all code paths in serve_assets function including path construction."""
-        try:
-            import app
-
-            with app.app.test_client() as client:
-                # This test ensures all lines in the serve_assets function are executed:
-                # Line 306: def serve_assets(filename: str) -> Any:
-                # Line 307: """Serve static UI assets (CSS, JS, images)"""
-                # Line 308: import os
-                # Line 309: (blank line)
-                # Line 310: ui_assets_dir = os.path.abspath(
-                # Line 311:     os.path.join(..., "ui", "assets")
-                # Line 312: )
-                # Line 313: return send_from_directory(ui_assets_dir, filename)
-
-                response = client.get("/assets/example.css")
-
-                # Any response (200, 404, or 500) means the function executed fully
-                assert response.status_code in [200, 404, 500]
-                print(f"✅ Complete serve_assets function: {response.status_code}")
-
-                # Test multiple requests to ensure consistency
-                for i in range(3):
-                    response2 = client.get("/assets/example.js")
-                    assert response2.status_code in [200, 404, 500]
-                print("✅ Consistent behavior across multiple requests")
-
-        except ImportError as e:
-            pytest.skip(f"ML dependencies not available: {e}")
-
-    def test_assets_send_from_directory_behavior(self):
-        """Test the send_from_directory functionality and error handling."""
-        try:
-            import app
-
-            with app.app.test_client() as client:
-                # Test the send_from_directory call with various asset types
-                test_assets = ["main.css", "app.js", "icon.png"]
-
-                for asset in test_assets:
-                    response = client.get(f"/assets/{asset}")
-
-                    if response.status_code == 200:
-                        # Test successful file serving headers and content
-                        assert asset in response.headers.get("Content-Disposition", "")
-                        assert len(response.data) > 0
-                        print(f"✅ send_from_directory headers correct for {asset}")
-
-                        # Test that file content is valid
-                        assert len(response.data) > 0
-                        print(f"✅ File content retrieved successfully for {asset}")
-
-                    elif response.status_code == 404:
-                        # Test that 404 is handled properly when file doesn't exist
-                        print(f"✅ 404 handling when {asset} not found")
-
-                    elif response.status_code == 500:
-                        # Test server error handling (e.g., permission issues)
-                        print(f"✅ Server error handling for {asset}")
-
-        except ImportError as e:
-            pytest.skip(f"ML dependencies not available: {e}")
-
-    def test_assets_http_methods_and_routing(self):
+        # Names outside VALID_ASSETS are rejected before any filesystem call
+        response = client.get("/assets/example.css")
+
+        # Any response (200, 404, or 500) means the function executed fully
+        assert response.status_code in _HANDLED_STATUSES
+
+        response2 = client.get("/assets/example.js")
+        assert response2.status_code in _HANDLED_STATUSES
+
+    @pytest.mark.parametrize(
+        "asset", ["css/styles.css", "js/app.js", "images/snapshot.jpg"]
+    )
+    def test_assets_serves_existing_files(self, client, asset):
+        """Test each asset type is served with its bytes and content type."""
+        response = client.get(f"/assets/{asset}")
+
+        assert response.status_code == 200
+        assert len(response.data) > 0
+        _assert_content_type(asset, response.content_type)
+
+        # Assets are shown inline by default, so no Content-Disposition is sent
+        assert "Content-Disposition" not in response.headers
+
+    def test_assets_cache_control_headers(self, client):
+        """Test assets are cacheable while the UI page is revalidated."""
+        response = client.get("/assets/css/styles.css")
+        assert response.status_code == 200
+        assert response.cache_control.public
+        assert response.cache_control.max_age == app.UI_ASSETS_MAX_AGE
+
+        page_response = client.get("/")
+        assert page_response.cache_control.max_age is None
+
+    def test_assets_conditional_get_returns_304(self, client):
+        """Test a matching If-None-Match is answered with an empty 304."""
+        response = client.get("/assets/css/styles.css")
+        etag = response.headers["ETag"]
+        assert etag == f'"{app.asset_etag(app.asset_stat("css/styles.css"))}"'
+
+        cached = client.get("/assets/css/styles.css", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.data == b""
+        assert cached.headers["ETag"] == etag
+
+        stale = client.get(
+            "/assets/css/styles.css", headers={"If-None-Match": '"stale"'}
+        )
+        assert stale.status_code == 200
+
+    def test_assets_if_modified_since_returns_304(self, client):
+        """Test an If-Modified-Since-only revalidation is answered with 304."""
+        response = client.get("/assets/css/styles.css")
+        last_modified = response.headers["Last-Modified"]
+
+        cached = client.get(
+            "/assets/css/styles.css", headers={"If-Modified-Since": last_modified}
+        )
+        assert cached.status_code == 304
+        assert cached.data == b""
+
+        stale = client.get(
+            "/assets/css/styles.css",
+            headers={"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"},
+        )
+        assert stale.status_code == 200
+
+    def test_assets_gzip_variant(self, client):
+        """Test text assets are served pre-compressed when gzip is accepted."""
+        plain = client.get("/assets/css/styles.css")
+        compressed = client.get(
+            "/assets/css/styles.css", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert compressed.status_code == 200
+        assert compressed.content_encoding == "gzip"
+        assert compressed.content_type == plain.content_type
+        assert gzip.decompress(compressed.data) == plain.data
+        assert compressed.headers["ETag"] != plain.headers["ETag"]
+        assert "Accept-Encoding" in compressed.vary
+        assert "Accept-Encoding" in plain.vary
+
+        image = client.get(
+            "/assets/images/snapshot.jpg", headers={"Accept-Encoding": "gzip"}
+        )
+        assert image.content_encoding is None
+
+    def test_gzip_ui_assets_skips_vanished_files(self, monkeypatch):
+        """Test startup gzipping skips assets removed since they were listed."""
+        monkeypatch.setattr(
+            app, "VALID_ASSETS", app.VALID_ASSETS | {"css/vanished.css"}
+        )
+
+        compressed = app.gzip_ui_assets()
+
+        assert "css/vanished.css" not in compressed
+        assert "css/styles.css" in compressed
+
+    def test_assets_bytes_cached_in_memory(self, client):
+        """Test repeat asset requests are served from the in-process cache."""
+        app.read_ui_asset.cache_clear()
+
+        first = client.get("/assets/images/snapshot.jpg")
+        second = client.get("/assets/images/snapshot.jpg")
+
+        assert first.status_code == second.status_code == 200
+        assert first.data == second.data
+        assert first.content_type == "image/jpeg"
+        info = app.read_ui_asset.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+        partial = client.get(
+            "/assets/images/snapshot.jpg", headers={"Range": "bytes=0-9"}
+        )
+        assert partial.status_code == 206
+        assert partial.data == first.data[:10]
+
+    def test_assets_file_removed_after_stat_returns_404(
+        self, client, tmp_path, monkeypatch
+    ):
+        """Test an asset deleted between the stat and the read is a 404."""
+        asset = tmp_path / "gone.css"
+        asset.write_text("body {}")
+        monkeypatch.setattr(app, "UI_ASSETS_DIR", str(tmp_path))
+        monkeypatch.setattr(app, "VALID_ASSETS", frozenset({"gone.css"}))
+        monkeypatch.setattr(app, "GZIPPED_ASSETS", {})
+
+        real_stat = app.asset_stat
+
+        def stat_then_remove(filename):
+            st = real_stat(filename)
+            asset.unlink()
+            return st
+
+        monkeypatch.setattr(app, "asset_stat", stat_then_remove)
+
+        response = client.get("/assets/gone.css")
+        assert response.status_code == 404
+
+    def test_assets_head_answered_from_stat(self, client):
+        """Test HEAD returns the GET headers without reading the file."""
+        app.read_ui_asset.cache_clear()
+
+        for headers in ({}, {"Accept-Encoding": "gzip"}):
+            head = client.head("/assets/css/styles.css", headers=headers)
+            get = client.get("/assets/css/styles.css", headers=headers)
+
+            assert head.status_code == 200
+            assert head.data == b""
+            assert head.content_length == len(get.data)
+            for name in ("Content-Type", "Content-Encoding", "ETag", "Vary"):
+                assert head.headers.get(name) == get.headers.get(name)
+
+        # Only the identity GET above read the file
+        assert app.read_ui_asset.cache_info().misses == 1
+
+        assert client.head("/assets/missing.css").status_code == 404
+
+    def test_assets_http_methods_and_routing(self, client):
         """Test HTTP methods and routing behavior for assets endpoint."""
-        try:
-            import app
-
-            with app.app.test_client() as client:
-                # Test GET method (should work)
-                get_response = client.get("/assets/style.css")
-                assert get_response.status_code in [200, 404, 500]
-                print(f"✅ GET /assets/style.css: {get_response.status_code}")
-
-                # Test POST method (should fail with 405 Method Not Allowed)
-                post_response = client.post("/assets/style.css")
-                assert post_response.status_code == 405
-                print("✅ POST /assets/* correctly rejected (405)")
-
-                # Test PUT method (should fail with 405)
-                put_response = client.put("/assets/app.js")
-                assert put_response.status_code == 405
-                print("✅ PUT /assets/* correctly rejected (405)")
-
-                # Test DELETE method (should fail with 405)
-                delete_response = client.delete("/assets/main.css")
-                assert delete_response.status_code == 405
-                print("✅ DELETE /assets/* correctly rejected (405)")
-
-        except ImportError as e:
-            pytest.skip(f"ML dependencies not available: {e}")
-
-    def test_assets_security_and_path_validation(self):
+        # The Allow header lists every method the route accepts
+        options_response = client.options("/assets/style.css")
+        allow = set(
+            options_response.headers.get("Allow", "").replace(" ", "").split(",")
+        )
+        assert "GET" in allow
+        assert allow <= {"GET", "HEAD", "OPTIONS"}
+
+        # Anything outside it is rejected with 405 Method Not Allowed
+        post_response = client.post("/assets/style.css")
+        assert post_response.status_code == 405
+
+    def test_assets_security_and_path_validation(self, client):
         """Test security measures and path validation for assets endpoint."""
-        try:
-            import app
-
-            with app.app.test_client() as client:
-                # Test path traversal attempts (security testing)
-                malicious_paths = [
-                    "../../../etc/passwd",
-                    "..\\..\\..\\windows\\system32\\config\\sam",
-                    "../config.json",
-                    "../../scripts/app.py",
-                    "../../../../../../../etc/hosts",
-                    "..%2F..%2F..%2Fetc%2Fpasswd",  # URL encoded
-                ]
-
-                for malicious_path in malicious_paths:
-                    response = client.get(f"/assets/{malicious_path}")
-
-                    # Should either be 404 (file not found) or proper security handling
-                    # Should NOT return 200 with sensitive file content
-                    assert response.status_code in [400, 404, 500]
-                    print(f"✅ Path traversal blocked: {malicious_path}")
-
-                # Test empty filename
-                empty_response = client.get("/assets/")
-                assert empty_response.status_code == 404
-                print("✅ Empty filename handled correctly")
-
-                # Test very long filename
-                long_filename = "a" * 1000 + ".css"
-                long_response = client.get(f"/assets/{long_filename}")
-                assert long_response.status_code in [
-                    404,
-                    414,
-                    500,
-                ]  # 414 = URI Too Long
-                print("✅ Long filename handled correctly")
-
-        except ImportError as e:
-            pytest.skip(f"ML dependencies not available: {e}")
-
-    def test_assets_various_file_types_and_extensions(self):
+        # Test path traversal attempts (security testing)
+        malicious_paths = [
+            "../../../etc/passwd",
+            "..\\..\\..\\windows\\system32\\config\\sam",
+            "../config.json",
+            "../../scripts/app.py",
+            "../../../../../../../etc/hosts",
+            "..%2F..%2F..%2Fetc%2Fpasswd",  # URL encoded
+        ]
+
+        for malicious_path in malicious_paths:
+            response = client.get(f"/assets/{malicious_path}")
+
+            # Should either be 404 (file not found) or proper security handling
+            # Should NOT return 200 with sensitive file content
+            assert response.status_code in [400, 404, 500]
+
+        # Names rejected before touching the filesystem
+        for rejected in ["style%00.css", "css/..%2Fstyles.css"]:
+            assert client.get(f"/assets/{rejected}").status_code == 404
+
+        # Test empty filename
+        empty_response = client.get("/assets/")
+        assert empty_response.status_code == 404
+
+        # Test very long filename
+        long_filename = "a" * 1000 + ".css"
+        long_response = client.get(f"/assets/{long_filename}")
+        assert long_response.status_code in [
+            404,
+            414,
+            500,
+        ]  # 414 = URI Too Long
+
+    def test_assets_various_file_types_and_extensions(self, client):
         """Test assets endpoint with various file types and extensions."""
-        try:
-            import app
-
-            with app.app.test_client() as client:
-                # Test various asset types that might be served
-                asset_types = [
-                    # CSS files
-                    "main.css",
-                    "style.css",
-                    "theme.css",
-                    "bootstrap.css",
-                    # JavaScript files
-                    "app.js",
-                    "main.js",
-                    "jquery.js",
-                    "bootstrap.js",
-                    # Images
-                    "logo.png",
-                    "favicon.ico",
-                    "background.jpg",
-                    "sprite.gif",
-                    # Fonts
-                    "font.woff",
-                    "icons.ttf",
-                    "symbols.eot",
-                    # Other common web assets
-                    "manifest.json",
-                    "sitemap.xml",
-                    "robots.txt",
-                ]
-
-                for asset in asset_types:
-                    response = client.get(f"/assets/{asset}")
-
-                    # Should handle all file types appropriately
-                    assert response.status_code in [200, 404, 500]
-                    print(f"✅ Asset type handled: {asset} ({response.status_code})")
-
-                    # If file exists, test content type is set
-                    if response.status_code == 200:
-                        assert response.content_type is not None
-                        print(
-                            f"✅ Content-Type set for {asset}: {response.content_type}"
-                        )
-
-        except ImportError as e:
-            pytest.skip(f"ML dependencies not available: {e}")
-
-    def test_assets_error_conditions_and_edge_cases(self):
+        # Test various asset types that might be served
+        asset_types = [
+            # CSS files
+            "main.css",
+            "style.css",
+            "theme.css",
+            "bootstrap.css",
+            # JavaScript files
+            "app.js",
+            "main.js",
+            "jquery.js",
+            "bootstrap.js",
+            # Images
+            "logo.png",
+            "favicon.ico",
+            "background.jpg",
+            "sprite.gif",
+            # Fonts
+            "font.woff",
+            "icons.ttf",
+            "symbols.eot",
+            # Other common web assets
+            "manifest.json",
+            "sitemap.xml",
+            "robots.txt",
+        ]
+
+        for asset in asset_types:
+            response = client.get(f"/assets/{asset}")
+
+            # Should handle all file types appropriately
+            assert response.status_code in _HANDLED_STATUSES
+
+            # If file exists, test content type is set
+            if response.status_code == 200:
+                assert response.content_type is not None
+                _assert_content_type(asset, response.content_type)
+
+    def test_assets_error_conditions_and_edge_cases(self, client):
         """Test various error conditions and edge cases for assets endpoint."""
-        try:
-            import app
-
-            with app.app.test_client() as client:
-                # Test with query parameters (should still work)
-                query_response = client.get("/assets/main.css?v=1.0&cache=false")
-                assert query_response.status_code in [200, 404, 500]
-                print(f"✅ /assets/* with query params: {query_response.status_code}")
-
-                # Test with fragments (should be ignored by server)
-                fragment_response = client.get("/assets/app.js#section1")
-                assert fragment_response.status_code in [200, 404, 500]
-                print(f"✅ /assets/* with fragment: {fragment_response.status_code}")
-
-                # Test with custom headers
-                headers = {
-                    "User-Agent": "Test-Browser/1.0",
-                    "Accept": "text/css,*/*;q=0.1",
-                    "Accept-Language": "en-US,en;q=0.9",
-                }
-                header_response = client.get("/assets/style.css", headers=headers)
-                assert header_response.status_code in [200, 404, 500]
-                print(f"✅ /assets/* with headers: {header_response.status_code}")
-
-                # Test multiple concurrent requests (basic concurrency)
-                responses = []
-                for i in range(5):
-                    resp = client.get(f"/assets/file{i}.css")
-                    responses.append(resp.status_code)
-
-                # All responses should be valid HTTP status codes
-                assert all(code in [200, 404, 500] for code in responses)
-                print(f"✅ Concurrent requests handled: {set(responses)}")
-
-        except ImportError as e:
-            pytest.skip(f"ML dependencies not available: {e}")
-
-    def test_assets_comprehensive_coverage_validation(self):
+        # Test with query parameters (should still work)
+        query_response = client.get("/assets/main.css?v=1.0&cache=false")
+        assert query_response.status_code in _HANDLED_STATUSES
+
+        # Test with fragments (should be ignored by server)
+        fragment_response = client.get("/assets/app.js#section1")
+        assert fragment_response.status_code in _HANDLED_STATUSES
+
+        # Test with custom headers
+        headers = {
+            "User-Agent": "Test-Browser/1.0",
+            "Accept": "text/css,*/*;q=0.1",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+        header_response = client.get("/assets/style.css", headers=headers)
+        assert header_response.status_code in _HANDLED_STATUSES
+
+        # Test multiple concurrent requests (basic concurrency). The shared
+        # client preserves request contexts, so each thread gets its own
+        def fetch(i):
+            return client.application.test_client().get(f"/assets/file{i}.css")
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = [resp.status_code for resp in executor.map(fetch, range(5))]
+
+        # All responses should be valid HTTP status codes
+        assert all(code in _HANDLED_STATUSES for code in responses)
+
+    def test_assets_comprehensive_coverage_validation(self, client):
         """Comprehensive test to ensure all assets endpoint code paths are covered."""
-        try:
-            import app
-
-            with app.app.test_client() as client:
-                # This is the master test that ensures we hit every single line
-                # in the serve_assets function for maximum coverage
-
-                # Execute the endpoint
-                response = client.get("/assets/comprehensive-test.css")
-
-                # Verify the function executed (any valid HTTP response means success)
-                assert response.status_code in [200, 404, 500]
-
-                # Log the exact behavior for debugging
-                print(f"✅ serve_assets endpoint response: {response.status_code}")
-                print(f"✅ Content-Type: {response.content_type}")
-                print(f"✅ Content-Length: {len(response.data)}")
-
-                if response.status_code == 200:
-                    print("✅ File served successfully - all code paths covered")
-                    # Verify file content is present
-                    assert len(response.data) > 0
-                    print(f"✅ Content preview: {response.data[:50]}...")
-
-                elif response.status_code == 404:
-                    print("✅ File not found - path construction executed successfully")
-
-                elif response.status_code == 500:
-                    print("✅ Server error - all code paths attempted")
-
-                # The key point: regardless of the response, if we get here,
-                # it means ALL lines in serve_assets function were executed:
-                # - import os (line 308)
-                # - os.path.abspath call (line 310)
-                # - os.path.join call (line 311)
-                # - send_from_directory call (line 313)
-                print("✅ ALL serve_assets function lines covered (308-313)")
-
-        except ImportError as e:
-            pytest.skip(f"ML dependencies not available: {e}")
+        # This is the master test that ensures we hit every single line
+        # in the serve_assets function for maximum coverage
+
+        # Execute the endpoint
+        response = client.get("/assets/comprehensive-test.css")
+
+        # Verify the function executed (any valid HTTP response means success)
+        assert response.status_code in _HANDLED_STATUSES
+
+        if response.status_code == 200:
+            # Verify file content is present
+            assert len(response.data) > 0
@@ -5,6 +5,7 @@ Tests target 80%+ coverage of the quality metrics calculation function,
 using Docker integration testing with real ML dependencies (OpenCV, NumPy).
 """
 
+import functools
 import os
 import sys
 
@@ -24,6 +25,23 @@ try:
 except ImportError:
     ML_AVAILABLE = False
 
+pytestmark = pytest.mark.skipif(
+    not ML_AVAILABLE, reason="ML dependencies not available"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _const_img(height, width, channels, value):
+    """Read-only uint8 image filled with one value, built once per shape.
+
+    calculate_face_quality_metrics never writes to its input, so cases
+    with the same shape and intensity share one array.
+    """
+    shape = (height, width, channels) if channels > 1 else (height, width)
+    img = np.full(shape, value, dtype=np.uint8)
+    img.setflags(write=False)
+    return img
+
 
 class TestCalculateQualityMetricsCoverage:
     """Comprehensive integration tests for calculate_face_quality_metrics() function."""
@@ -31,10 +49,7 @@ class TestCalculateQualityMetricsCoverage:
     def test_quality_metrics_grayscale_conversion_color_image(self):
         """Test quality metrics with color (3-channel) image - grayscale
         conversion path"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
-        face_crop = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        face_crop = _const_img(100, 100, 3, 128)
         metrics = calculate_face_quality_metrics(face_crop)
 
         assert all(
@@ -53,10 +68,7 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_grayscale_input_direct_path(self):
         """Test quality metrics with grayscale (2D) image - direct gray path"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
-        face_crop = np.ones((100, 100), dtype=np.uint8) * 128
+        face_crop = _const_img(100, 100, 1, 128)
         metrics = calculate_face_quality_metrics(face_crop)
 
         assert metrics["face_area"] == 10000.0
@@ -65,45 +77,36 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_sharpness_calculation(self):
         """Test Laplacian variance sharpness metric calculation"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
         face_crop = np.zeros((100, 100, 3), dtype=np.uint8)
         face_crop[25:75, 25:75] = 255  # White square on black
 
         metrics = calculate_face_quality_metrics(face_crop)
         assert metrics["sharpness"] > 0.0
 
-    def test_quality_metrics_face_area_calculation(self):
+    @pytest.mark.parametrize(
+        "width,height,expected_area",
+        [(50, 50, 2500.0), (100, 100, 10000.0), (200, 150, 30000.0)],
+    )
+    def test_quality_metrics_face_area_calculation(self, width, height, expected_area):
         """Test face area metric for various image sizes"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
-        test_cases = [(50, 50, 2500.0), (100, 100, 10000.0), (200, 150, 30000.0)]
-
-        for width, height, expected_area in test_cases:
-            face_crop = np.ones((height, width, 3), dtype=np.uint8) * 128
-            metrics = calculate_face_quality_metrics(face_crop)
-            assert metrics["face_area"] == expected_area
-
-    def test_quality_metrics_brightness_calculation(self):
+        face_crop = _const_img(height, width, 3, 128)
+        metrics = calculate_face_quality_metrics(face_crop)
+        assert metrics["face_area"] == expected_area
+
+    @pytest.mark.parametrize(
+        "intensity,expected_brightness", [(0, 0.0), (128, 128.0), (255, 255.0)]
+    )
+    def test_quality_metrics_brightness_calculation(
+        self, intensity, expected_brightness
+    ):
         """Test brightness metric (mean intensity) calculation"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
-        test_cases = [(0, 0.0), (128, 128.0), (255, 255.0)]
-
-        for intensity, expected_brightness in test_cases:
-            face_crop = np.ones((100, 100, 3), dtype=np.uint8) * intensity
-            metrics = calculate_face_quality_metrics(face_crop)
-            assert abs(metrics["brightness"] - expected_brightness) < 0.1
+        face_crop = _const_img(100, 100, 3, intensity)
+        metrics = calculate_face_quality_metrics(face_crop)
+        assert abs(metrics["brightness"] - expected_brightness) < 0.1
 
     def test_quality_metrics_contrast_calculation(self):
         """Test contrast metric (standard deviation) calculation"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
-        low_contrast = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        low_contrast = _const_img(100, 100, 3, 128)
         high_contrast = np.zeros((100, 100, 3), dtype=np.uint8)
         high_contrast[50:, :] = 255
 
@@ -115,9 +118,6 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_quality_score_normalization(self):
         """Test quality score weighted combination and normalization"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
         optimal_face = np.random.randint(100, 180, (100, 100, 3), dtype=np.uint8)
         metrics = calculate_face_quality_metrics(optimal_face)
 
@@ -126,25 +126,17 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_sharpness_score_normalization(self):
         """Test sharpness score capping at 100"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
         # Extremely sharp checkerboard
         face_crop = np.zeros((100, 100, 3), dtype=np.uint8)
-        for i in range(0, 100, 2):
-            for j in range(0, 100, 2):
-                face_crop[i : i + 1, j : j + 1] = 255
+        face_crop[::2, ::2] = 255
 
         metrics = calculate_face_quality_metrics(face_crop)
         assert metrics["quality_score"] <= 1.0
 
     def test_quality_metrics_size_score_normalization(self):
         """Test size score capping at 10000 pixels (100x100)"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
-        large_face = np.ones((200, 200, 3), dtype=np.uint8) * 128
-        small_face = np.ones((50, 50, 3), dtype=np.uint8) * 128
+        large_face = _const_img(200, 200, 3, 128)
+        small_face = _const_img(50, 50, 3, 128)
 
         large_metrics = calculate_face_quality_metrics(large_face)
         small_metrics = calculate_face_quality_metrics(small_face)
@@ -155,14 +147,11 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_brightness_score_optimal_128(self):
         """Test brightness score optimization around 128 intensity"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
         test_intensities = [0, 64, 128, 192, 255]
         scores = []
 
         for intensity in test_intensities:
-            face_crop = np.ones((100, 100, 3), dtype=np.uint8) * intensity
+            face_crop = _const_img(100, 100, 3, intensity)
             metrics = calculate_face_quality_metrics(face_crop)
             scores.append(metrics["quality_score"])
 
@@ -170,9 +159,6 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_contrast_score_capping(self):
         """Test contrast score capping at 64"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
         high_contrast = np.zeros((100, 100, 3), dtype=np.uint8)
         high_contrast[:, 50:] = 255
 
@@ -183,10 +169,7 @@ class TestCalculateQualityMetricsCoverage:
     def test_quality_metrics_weighted_combination_formula(self):
         """Test weighted quality score formula: 40% sharp + 20% size +
         20% bright + 20% contrast"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
-        face_crop = np.ones((100, 100, 3), dtype=np.uint8) * 128
+        face_crop = _const_img(100, 100, 3, 128)
         metrics = calculate_face_quality_metrics(face_crop)
 
         assert 0.0 < metrics["quality_score"] <= 1.0
@@ -197,9 +180,6 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_exception_handling_invalid_input(self):
         """Test exception handling with invalid/malformed input"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
         metrics = calculate_face_quality_metrics(None)
 
         assert metrics["sharpness"] == 0.0
@@ -210,9 +190,6 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_exception_handling_empty_array(self):
         """Test exception handling with empty numpy array"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
         empty_array = np.array([])
         metrics = calculate_face_quality_metrics(empty_array)
 
@@ -220,9 +197,6 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_exception_handling_wrong_dimensions(self):
         """Test exception handling with unexpected array dimensions"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
         invalid_array = np.ones(100, dtype=np.uint8)
         metrics = calculate_face_quality_metrics(invalid_array)
 
@@ -230,9 +204,6 @@ class TestCalculateQualityMetricsCoverage:
 
     def test_quality_metrics_all_code_paths_comprehensive(self):
         """Comprehensive test covering all code paths in calculate_quality_metrics"""
-        if not ML_AVAILABLE:
-            pytest.skip("ML dependencies not available")
-
         # Test 1: Color image (3-channel) - grayscale conversion path
         color_face = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
         color_metrics = calculate_face_quality_metrics(color_face)
@@ -256,9 +227,9 @@ class TestCalculateQualityMetricsCoverage:
 
         # Test 3: Various quality levels
         test_faces = [
-            np.ones((50, 50, 3), dtype=np.uint8) * 0,
-            np.ones((100, 100, 3), dtype=np.uint8) * 128,
-            np.ones((200, 200, 3), dtype=np.uint8) * 255,
+            _const_img(50, 50, 3, 0),
+            _const_img(100, 100, 3, 128),
+            _const_img(200, 200, 3, 255),
         ]
 
         for face in test_faces:
@@ -7,76 +7,165 @@ Tests cover all code paths in qdrant_adapter.py lines 401-434:
 - Recent detection found within time window
 - Exception handling during check
 
-Uses shared Qdrant adapter fixture to avoid storage locking issues.
+Uses shared Qdrant adapter fixture to avoid storage locking issues. The
+faces the checks look for are seeded once per class with a single upsert.
 """
 
+import itertools
 import time
-import uuid
 
-import numpy as np
 import pytest
 
+_id_counter = itertools.count()
 
+
+def _uid(prefix):
+    """Return an id unique within this test run (no UUID generation needed)."""
+    return f"{prefix}_{next(_id_counter)}"
+
+
+@pytest.fixture(scope="class")
+def preloaded_events(shared_qdrant_adapter, dummy_embedding):
+    """
+    Seed one recent and one stale face in a single batched upsert.
+
+    Event ids carry a prefix only this module uses, so points left by
+    earlier tests cannot match.
+
+    Args:
+        shared_qdrant_adapter: Session-scoped Qdrant adapter
+        dummy_embedding: Session-scoped read-only embedding
+
+    Yields:
+        Dict mapping "recent"/"stale" to their event_id and face_id
+    """
+    from qdrant_adapter import DEDUPLICATION_WINDOW
+
+    now = int(time.time())
+    timestamps = {
+        "recent": now,
+        # Timestamp older than deduplication window
+        "stale": now - (max(DEDUPLICATION_WINDOW, 0) + 100),
+    }
+    events = {
+        key: {"event_id": _uid("recent_check_event"), "face_id": _uid("face")}
+        for key in timestamps
+    }
+
+    shared_qdrant_adapter.save_faces(
+        [
+            (
+                {
+                    "face_id": event["face_id"],
+                    "name": f"Test Person ({key})",
+                    "event_id": event["event_id"],
+                    "timestamp": timestamps[key],
+                },
+                dummy_embedding,
+            )
+            for key, event in events.items()
+        ]
+    )
+
+    yield events
+
+    # Drop only the seeded points so the next test's reset finds an empty
+    # collection and has nothing to recreate
+    from qdrant_adapter import COLLECTION_NAME
+    from qdrant_client.http import models
+
+    event_ids = [event["event_id"] for event in events.values()]
+    shared_qdrant_adapter.client.delete(
+        collection_name=COLLECTION_NAME,
+        points_selector=models.FilterSelector(
+            filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="event_id", match=models.MatchAny(any=event_ids)
+                    )
+                ]
+            )
+        ),
+    )
+
+
+@pytest.mark.qdrant_preloaded
+@pytest.mark.usefixtures("preloaded_events")
 class TestCheckRecentDetectionFunction:
     """Test check_recent_detection() function with shared Qdrant adapter."""
 
-    def test_check_recent_detection_no_recent_faces(self, qdrant_adapter):
+    def test_check_recent_detection_disabled(
+        self, shared_qdrant_adapter, preloaded_events, monkeypatch
+    ):
+        """
+        Test deduplication disabled (DEDUPLICATION_WINDOW <= 0, lines 401-402).
+
+        Patches the module constant instead of reloading qdrant_adapter, so
+        no second embedded client contends for the storage lock.
+
+        Args:
+            shared_qdrant_adapter: Session-scoped Qdrant adapter
+            preloaded_events: Class-scoped seeded events
+            monkeypatch: pytest monkeypatch fixture
+        """
+        import qdrant_adapter as qdrant_module
+
+        monkeypatch.setattr(qdrant_module, "DEDUPLICATION_WINDOW", 0)
+
+        # Even a face saved just now is ignored when the window is disabled
+        event_id = preloaded_events["recent"]["event_id"]
+        result = shared_qdrant_adapter.check_recent_detection(event_id)
+
+        assert result is False
+
+    def test_check_recent_detection_no_recent_faces(self, shared_qdrant_adapter):
         """
         Test when no recent detections exist (lines 404-423, 430).
 
         Should return False when event_id has no faces in time window.
 
         Args:
-            qdrant_adapter: Shared Qdrant adapter fixture (auto-cleaned)
+            shared_qdrant_adapter: Session-scoped Qdrant adapter
         """
         # Use a unique event_id that definitely doesn't exist
-        unique_event_id = f"test_event_{uuid.uuid4()}"
+        unique_event_id = _uid("recent_check_event")
 
         # Check for recent detection (should be False - no faces)
-        result = qdrant_adapter.check_recent_detection(unique_event_id)
+        result = shared_qdrant_adapter.check_recent_detection(unique_event_id)
 
         assert result is False
 
-    def test_check_recent_detection_found(self, qdrant_adapter):
+    def test_check_recent_detection_found(
+        self, shared_qdrant_adapter, preloaded_events
+    ):
         """
         Test when recent detection is found (lines 404-430).
 
-        Save a face then immediately check - should find it.
+        The face seeded with the current timestamp should be found.
 
         Args:
-            qdrant_adapter: Shared Qdrant adapter fixture (auto-cleaned)
+            shared_qdrant_adapter: Session-scoped Qdrant adapter
+            preloaded_events: Class-scoped seeded events
         """
-        # Create and save a face with current timestamp
-        event_id = f"test_event_{uuid.uuid4()}"
-        face_id = str(uuid.uuid4())
-
-        face_data = {
-            "face_id": face_id,
-            "name": "Test Person",
-            "event_id": event_id,
-            "timestamp": int(time.time()),  # Current time
-        }
-
-        embedding = np.random.rand(512).astype(np.float32)
-
-        # Save the face
-        saved_id = qdrant_adapter.save_face(face_data, embedding)
-        assert saved_id == face_id
+        event_id = preloaded_events["recent"]["event_id"]
 
         # Check for recent detection (should be True)
-        result = qdrant_adapter.check_recent_detection(event_id)
+        result = shared_qdrant_adapter.check_recent_detection(event_id)
 
         # Should find the recent detection
         assert result is True
 
-    def test_check_recent_detection_outside_window(self, qdrant_adapter):
+    def test_check_recent_detection_outside_window(
+        self, shared_qdrant_adapter, preloaded_events
+    ):
         """
         Test when detection exists but is outside time window (lines 404-430).
 
-        Save a face with old timestamp - should not find it.
+        The face seeded with an old timestamp should not be found.
 
         Args:
-            qdrant_adapter: Shared Qdrant adapter fixture (auto-cleaned)
+            shared_qdrant_adapter: Session-scoped Qdrant adapter
+            preloaded_events: Class-scoped seeded events
         """
         from qdrant_adapter import DEDUPLICATION_WINDOW
 
@@ -84,48 +173,31 @@ class TestCheckRecentDetectionFunction:
         if not DEDUPLICATION_WINDOW or DEDUPLICATION_WINDOW <= 0:
             pytest.skip("Deduplication window disabled")
 
-        # Create face with timestamp outside window
-        event_id = f"test_event_{uuid.uuid4()}"
-        face_id = str(uuid.uuid4())
-
-        # Timestamp older than deduplication window
-        old_timestamp = int(time.time()) - (DEDUPLICATION_WINDOW + 100)
-
-        face_data = {
-            "face_id": face_id,
-            "name": "Old Face",
-            "event_id": event_id,
-            "timestamp": old_timestamp,
-        }
-
-        embedding = np.random.rand(512).astype(np.float32)
-
-        # Save the old face
-        qdrant_adapter.save_face(face_data, embedding)
+        event_id = preloaded_events["stale"]["event_id"]
 
         # Check for recent detection (should be False - too old)
-        result = qdrant_adapter.check_recent_detection(event_id)
+        result = shared_qdrant_adapter.check_recent_detection(event_id)
 
         assert result is False
 
-    def test_check_recent_detection_exception_handler(self, qdrant_adapter):
+    def test_check_recent_detection_exception_handler(self, shared_qdrant_adapter):
         """
         Test exception handling during check (lines 432-434).
 
         Mock Qdrant client error to trigger exception path.
 
         Args:
-            qdrant_adapter: Shared Qdrant adapter fixture (auto-cleaned)
+            shared_qdrant_adapter: Session-scoped Qdrant adapter
         """
         from unittest.mock import patch
 
-        # Mock client.scroll to raise an exception
-        with patch.object(qdrant_adapter.client, "scroll") as mock_scroll:
-            mock_scroll.side_effect = RuntimeError("Qdrant connection failed")
+        # Mock client.count to raise an exception
+        with patch.object(shared_qdrant_adapter.client, "count") as mock_count:
+            mock_count.side_effect = RuntimeError("Qdrant connection failed")
 
             # Try to check recent detection
-            result = qdrant_adapter.check_recent_detection("test_event_error")
+            result = shared_qdrant_adapter.check_recent_detection("test_event_error")
 
             # Should return False due to exception
             assert result is False
-            mock_scroll.assert_called_once()
+            mock_count.assert_called_once()
@@ -23,6 +23,7 @@ except ImportError:
     ML_AVAILABLE = False
 
 
+@pytest.mark.xdist_group(name="ml_models")
 class TestEnhancedThumbnailsRealML:
     """Test enhanced thumbnail generation with real ML pipeline."""
 
@@ -357,6 +358,7 @@ class TestEnhancedThumbnailsRealML:
             pytest.skip(f"Dependencies not available: {e}")
 
 
+@pytest.mark.xdist_group(name="ml_models")
 class TestSuperResolutionRealESRGAN:
     """
     Integration tests for Real-ESRGAN super-resolution.
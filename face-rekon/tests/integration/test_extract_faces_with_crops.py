@@ -24,6 +24,7 @@ except ImportError:
     ML_AVAILABLE = False
 
 
+@pytest.mark.xdist_group(name="ml_models")
 class TestExtractFacesWithCropsRealImages:
     """Comprehensive tests for extract_faces_with_crops() with real images."""
 
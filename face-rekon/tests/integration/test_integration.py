@@ -4,116 +4,60 @@ Designed to run in Docker with full ML dependencies.
 Tests all major components: Flask API, ML pipeline, database operations.
 """
 import base64
-import io
-import json
 import os
 import sys
+import uuid
 
 import numpy as np
 import pytest
-from PIL import Image
 
 # Add the scripts directory to the Python path
 scripts_path = os.path.join(os.path.dirname(__file__), "../../scripts")
 if scripts_path not in sys.path:
     sys.path.insert(0, scripts_path)
 
+# Face ids exercising the GET/PATCH face routes, with readable test ids
+_EDGE_FACE_IDS = (
+    "existing_face_id",
+    "non_existent_face_id",
+    str(uuid.uuid4()),
+    "face_with_special_chars_123!@#",
+    "",  # Empty face ID
+    "a" * 100,  # Very long face ID
+)
+_EDGE_FACE_ID_NAMES = (
+    "existing",
+    "missing",
+    "valid-uuid",
+    "special-chars",
+    "empty",
+    "long",
+)
+
 # Note: TestRecognizeEndpointCoverage is defined in test_recognize_endpoint.py
 # and runs separately to avoid duplication
 
 
-@pytest.fixture
-def test_image_base64():
-    """Create a realistic test image for face detection"""
-    img = Image.new("RGB", (640, 480), color=(240, 240, 240))
-    from PIL import ImageDraw
-
-    draw = ImageDraw.Draw(img)
-
-    # Create a realistic face pattern
-    center = (320, 240)
-    width, height = 160, 200
-
-    # Face oval
-    face_bbox = [
-        center[0] - width // 2,
-        center[1] - height // 2,
-        center[0] + width // 2,
-        center[1] + height // 2,
-    ]
-    draw.ellipse(face_bbox, fill=(255, 220, 177), outline=(200, 160, 120), width=2)
-
-    # Eyes
-    left_eye = (center[0] - 30, center[1] - 40)
-    right_eye = (center[0] + 30, center[1] - 40)
-
-    for eye_center in [left_eye, right_eye]:
-        draw.ellipse(
-            [
-                eye_center[0] - 15,
-                eye_center[1] - 10,
-                eye_center[0] + 15,
-                eye_center[1] + 10,
-            ],
-            fill="white",
-            outline="black",
-            width=2,
-        )
-        draw.ellipse(
-            [
-                eye_center[0] - 6,
-                eye_center[1] - 6,
-                eye_center[0] + 6,
-                eye_center[1] + 6,
-            ],
-            fill="black",
-        )
-
-    # Nose
-    draw.polygon(
-        [
-            (center[0], center[1]),
-            (center[0] - 10, center[1] + 20),
-            (center[0] + 10, center[1] + 20),
-        ],
-        fill=(210, 180, 140),
-    )
-
-    # Mouth
-    draw.arc(
-        [center[0] - 30, center[1] + 50, center[0] + 30, center[1] + 80],
-        start=0,
-        end=180,
-        fill="red",
-        width=3,
-    )
-
-    buffered = io.BytesIO()
-    img.save(buffered, format="JPEG", quality=95)
-    return base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-
 @pytest.mark.integration
 class TestFlaskAPI:
     """Test Flask API endpoints with real ML backend"""
 
-    def test_ping_endpoint(self):
+    def test_ping_endpoint(self, api_prefix):
         """Test basic connectivity"""
         try:
             import app
 
             with app.app.test_client() as client:
-                response = client.get("/face-rekon/ping")
+                response = client.get(f"{api_prefix}/ping")
                 if response.status_code == 200:
-                    data = json.loads(response.data)
-                    assert "pong" in data
+                    assert response.data == b'{"pong": true}\n'
                     print("✅ Ping endpoint working")
                 else:
                     print(f"✅ Ping endpoint response: {response.status_code}")
         except ImportError:
             pytest.skip("Flask app not available")
 
-    def test_recognize_endpoint(self, test_image_base64):
+    def test_recognize_endpoint(self, api_prefix, test_image_base64):
         """Test face recognition endpoint with real image"""
         try:
             import app
@@ -125,40 +69,37 @@ class TestFlaskAPI:
                 }
 
                 response = client.post(
-                    "/face-rekon/recognize",
-                    data=json.dumps(request_data),
-                    content_type="application/json",
+                    f"{api_prefix}/recognize",
+                    json=request_data,
                 )
 
                 print(f"✅ Recognize endpoint: {response.status_code}")
                 if response.status_code == 200:
-                    data = json.loads(response.data)
-                    assert "status" in data
-                    assert "faces_count" in data
-                    assert "faces" in data
+                    data = response.get_json()
+                    assert {"status", "faces_count", "faces"} <= data.keys()
                     print(f"   Result: {data['status']}, {data['faces_count']} faces")
 
         except ImportError:
             pytest.skip("Flask app not available")
 
-    def test_get_unclassified_endpoint(self):
+    def test_get_unclassified_endpoint(self, api_prefix):
         """Test get unclassified faces endpoint"""
         try:
             import app
 
             with app.app.test_client() as client:
-                response = client.get("/face-rekon/")
+                response = client.get(f"{api_prefix}/")
 
                 print(f"✅ Get unclassified: {response.status_code}")
                 if response.status_code == 200:
-                    data = json.loads(response.data)
+                    data = response.get_json()
                     assert isinstance(data, list)
                     print(f"   Found {len(data)} unclassified faces")
 
         except ImportError:
             pytest.skip("Flask app not available")
 
-    def test_update_face_endpoint(self):
+    def test_update_face_endpoint(self, api_prefix):
         """Test face update endpoint"""
         try:
             import app
@@ -170,9 +111,8 @@ class TestFlaskAPI:
                 }
 
                 response = client.patch(
-                    "/face-rekon/test_face_integration",
-                    data=json.dumps(update_data),
-                    content_type="application/json",
+                    f"{api_prefix}/test_face_integration",
+                    json=update_data,
                 )
 
                 print(f"✅ Update face: {response.status_code}")
@@ -182,51 +122,57 @@ class TestFlaskAPI:
             pytest.skip("Flask app not available")
 
 
+@pytest.fixture(scope="module")
+def qdrant_adapter_module():
+    """The qdrant_adapter module, imported once; skips when unavailable."""
+    return pytest.importorskip("qdrant_adapter", reason="QdrantAdapter not available")
+
+
+@pytest.fixture(scope="class")
+def _bind_clasificador(request, shared_ml_models):
+    """Expose the session's clasificador as cls.clasificador (None without ML)."""
+    request.cls.clasificador = (shared_ml_models or {}).get("clasificador")
+
+
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="ml_models")
+@pytest.mark.usefixtures("_bind_clasificador")
 class TestMLPipeline:
     """Test ML pipeline components"""
 
     def test_clasificador_functions(self):
         """Test core clasificador functions"""
-        try:
-            import clasificador
-
-            # Test get_unclassified_faces
-            unclassified = clasificador.get_unclassified_faces()
-            assert isinstance(unclassified, list)
-            print(f"✅ Clasificador unclassified: {len(unclassified)} faces")
+        if self.clasificador is None:
+            pytest.skip("Clasificador not available")
 
-            # Test other available functions
-            functions_to_test = [
-                "get_face",
-                "update_face",
-            ]
+        # Test get_unclassified_faces
+        unclassified = self.clasificador.get_unclassified_faces()
+        assert isinstance(unclassified, list)
+        print(f"✅ Clasificador unclassified: {len(unclassified)} faces")
 
-            for func_name in functions_to_test:
-                if hasattr(clasificador, func_name):
-                    print(f"✅ Clasificador has {func_name}")
+        # Test other available functions
+        functions_to_test = [
+            "get_face",
+            "update_face",
+        ]
 
-        except ImportError:
-            pytest.skip("Clasificador not available")
+        for func_name in functions_to_test:
+            if hasattr(self.clasificador, func_name):
+                print(f"✅ Clasificador has {func_name}")
 
     def test_insightface_integration(self):
         """Test InsightFace ML model"""
-        try:
-            import numpy as np
-            from insightface.app import FaceAnalysis
-
-            # Test model initialization
-            app = FaceAnalysis()
-            app.prepare(ctx_id=-1, det_size=(640, 640))  # CPU mode
-            print("✅ InsightFace model loaded")
+        # Skip before building any input when the ML stack never loaded
+        if self.clasificador is None:
+            pytest.skip("InsightFace not available")
 
-            # Test with synthetic image
-            test_img = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
-            faces = app.get(test_img)
-            print(f"✅ InsightFace processed image: {len(faces)} faces detected")
+        # The session already prepared the model clasificador uses
+        app = self.clasificador.app
 
-        except ImportError:
-            pytest.skip("InsightFace not available")
+        # Test with synthetic image
+        test_img = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+        faces = app.get(test_img)
+        print(f"✅ InsightFace processed image: {len(faces)} faces detected")
 
     def test_opencv_operations(self):
         """Test OpenCV image processing"""
@@ -273,13 +219,24 @@ class TestVectorDatabase:
         except ImportError:
             pytest.skip("QdrantAdapter not available")
 
-    def test_qdrant_save_and_search(self):
+    def test_get_unclassified_faces_excludes_named(
+        self, qdrant_adapter, unclassified_face_variants
+    ):
+        """Only faces still named "unknown" are listed as unclassified"""
+        qdrant_adapter.save_faces(
+            [(dict(data), emb) for data, emb in unclassified_face_variants]
+        )
+
+        unclassified = qdrant_adapter.get_unclassified_faces()
+        assert {face["face_id"] for face in unclassified} == {
+            "unclassified_api_1",
+            "unclassified_api_2",
+        }
+
+    def test_qdrant_save_and_search(self, qdrant_adapter):
         """Test save and search operations"""
         try:
-            import numpy as np
-            import qdrant_adapter
-
-            adapter = qdrant_adapter.get_qdrant_adapter()
+            adapter = qdrant_adapter
 
             # Test save operation
             face_data = {
@@ -416,13 +373,10 @@ class TestSystemIntegration:
             with app.app.test_client() as client:
                 response = client.post(
                     "/face-rekon/recognize",
-                    data=json.dumps(
-                        {
-                            "image_base64": test_image_base64,
-                            "event_id": "integration_workflow_001",
-                        }
-                    ),
-                    content_type="application/json",
+                    json={
+                        "image_base64": test_image_base64,
+                        "event_id": "integration_workflow_001",
+                    },
                 )
                 workflow_results["api_response"] = response.status_code
                 print(f"✅ Workflow step 1 - API: {response.status_code}")
@@ -458,9 +412,9 @@ class TestSystemIntegration:
             start_time = time.time()
             operations = 0
 
-            for i in range(10):
+            embeddings = np.random.default_rng(0).random((10, 512), dtype=np.float32)
+            for i, embedding in enumerate(embeddings):
                 try:
-                    embedding = np.random.rand(512).astype(np.float32)
                     face_data = {
                         "event_id": f"perf_test_{i}",
                         "detected_at": "2023-01-01T12:00:00Z",
@@ -503,6 +457,7 @@ class TestFlaskAPIExtended:
             import app
 
             with app.app.test_client() as client:
+                # UI asset URLs probed by the static serving test
                 static_files = [
                     "/face-rekon/ui/css/styles.css",
                     "/face-rekon/ui/js/main.js",
@@ -523,19 +478,22 @@ class TestFlaskAPIExtended:
 
             with app.app.test_client() as client:
                 # Test error scenarios for coverage
+                # Only the malformed body needs a raw payload; the rest use json=
                 error_scenarios = [
-                    ("Invalid JSON", "invalid json data"),
-                    ("Missing image", json.dumps({"source": "test"})),
-                    ("Invalid base64", json.dumps({"image": "invalid_base64"})),
-                    ("Empty payload", json.dumps({})),
+                    (
+                        "Invalid JSON",
+                        {
+                            "data": "invalid json data",
+                            "content_type": "application/json",
+                        },
+                    ),
+                    ("Missing image", {"json": {"source": "test"}}),
+                    ("Invalid base64", {"json": {"image": "invalid_base64"}}),
+                    ("Empty payload", {"json": {}}),
                 ]
 
-                for desc, payload in error_scenarios:
-                    response = client.post(
-                        "/face-rekon/recognize",
-                        data=payload,
-                        content_type="application/json",
-                    )
+                for desc, post_kwargs in error_scenarios:
+                    response = client.post("/face-rekon/recognize", **post_kwargs)
                     print(f"✅ Error scenario '{desc}': {response.status_code}")
 
                 # Test with different valid request formats
@@ -554,8 +512,7 @@ class TestFlaskAPIExtended:
                 for variation in valid_variations:
                     response = client.post(
                         "/face-rekon/recognize",
-                        data=json.dumps(variation),
-                        content_type="application/json",
+                        json=variation,
                     )
                     print(f"✅ Request variation: {response.status_code}")
 
@@ -595,8 +552,7 @@ class TestFlaskAPIExtended:
                 for scenario in url_scenarios:
                     response = client.post(
                         "/face-rekon/load-snapshot",
-                        data=json.dumps(scenario),
-                        content_type="application/json",
+                        json=scenario,
                     )
                     print(f"✅ Load snapshot scenario: {response.status_code}")
 
@@ -608,33 +564,27 @@ class TestFlaskAPIExtended:
 class TestQdrantAdapterExtended:
     """Extended Qdrant adapter tests targeting qdrant_adapter.py coverage gaps"""
 
-    def test_qdrant_initialization_scenarios(self):
+    def test_qdrant_initialization_scenarios(self, qdrant_adapter_module):
         """Test different Qdrant initialization paths"""
-        try:
-            import qdrant_adapter
-
-            # Test embedded initialization with different paths
-            init_scenarios = [
-                {"use_embedded": True, "path": "/tmp/test_qdrant_1"},
-                {"use_embedded": True, "path": "/tmp/test_qdrant_2"},
-            ]
+        # Test embedded initialization with different paths
+        init_scenarios = [
+            {"use_embedded": True, "path": "/tmp/test_qdrant_1"},
+            {"use_embedded": True, "path": "/tmp/test_qdrant_2"},
+        ]
 
-            for scenario in init_scenarios:
-                try:
-                    adapter = qdrant_adapter.QdrantAdapter(
-                        use_embedded=True, path=scenario["path"]
-                    )
-                    print(f"✅ Qdrant init embedded: {scenario['path']}")
-
-                    # Test collection management
-                    adapter.ensure_collection_exists()
-                    print(f"✅ Collection management: {scenario['path']}")
+        for scenario in init_scenarios:
+            try:
+                adapter = qdrant_adapter_module.QdrantAdapter(
+                    use_embedded=True, path=scenario["path"]
+                )
+                print(f"✅ Qdrant init embedded: {scenario['path']}")
 
-                except Exception as e:
-                    print(f"✅ Qdrant init handled: {type(e).__name__}")
+                # Test collection management
+                adapter.ensure_collection_exists()
+                print(f"✅ Collection management: {scenario['path']}")
 
-        except ImportError:
-            pytest.skip("QdrantAdapter not available")
+            except Exception as e:
+                print(f"✅ Qdrant init handled: {type(e).__name__}")
 
     def test_vector_operations_comprehensive(self, qdrant_adapter):
         """Test comprehensive vector operations for coverage"""
@@ -699,55 +649,54 @@ class TestQdrantAdapterExtended:
 
 
 @pytest.mark.integration
+@pytest.mark.usefixtures("_bind_clasificador")
 class TestClasificadorExtended:
     """Extended clasificador tests targeting remaining coverage gaps"""
 
     def test_face_management_operations_extended(self):
         """Test extended face management operations for coverage"""
-        try:
-            import uuid
+        if self.clasificador is None:
+            pytest.skip("Face management not available")
+        clasificador = self.clasificador
 
-            import clasificador
+        # Test face retrieval with pagination scenarios
+        pagination_scenarios = [
+            {"page": 1, "per_page": 5},
+            {"page": 2, "per_page": 10},
+            {"page": 1, "per_page": 20},
+        ]
 
-            # Test face retrieval with pagination scenarios
-            pagination_scenarios = [
-                {"page": 1, "per_page": 5},
-                {"page": 2, "per_page": 10},
-                {"page": 1, "per_page": 20},
-            ]
+        for scenario in pagination_scenarios:
+            try:
+                faces = clasificador.get_unclassified_faces(**scenario)
+                print(f"✅ Pagination {scenario}: {len(faces)} faces")
+            except Exception as e:
+                print(f"✅ Pagination {scenario} handled: {type(e).__name__}")
 
-            for scenario in pagination_scenarios:
-                try:
-                    faces = clasificador.get_unclassified_faces(**scenario)
-                    print(f"✅ Pagination {scenario}: {len(faces)} faces")
-                except Exception as e:
-                    print(f"✅ Pagination {scenario} handled: {type(e).__name__}")
-
-            # Test face updates with different data scenarios
-            test_face_id = str(uuid.uuid4())
-            update_scenarios = [
-                {"name": "Test Person", "tags": ["test"]},
-                {"name": "Another Person", "relationship": "friend"},
-                {"tags": ["automated", "test"]},
-                {},  # Empty update
-            ]
+        # Test face updates with different data scenarios
+        test_face_id = str(uuid.uuid4())
 
-            for i, update_data in enumerate(update_scenarios):
-                try:
-                    result = clasificador.update_face(test_face_id, **update_data)
-                    print(f"✅ Face update {i}: {result}")
-                except Exception as e:
-                    print(f"✅ Face update {i} handled: {type(e).__name__}")
+        # Keyword updates passed straight to clasificador.update_face
+        update_scenarios = [
+            {"name": "Test Person", "tags": ["test"]},
+            {"name": "Another Person", "relationship": "friend"},
+            {"tags": ["automated", "test"]},
+            {},  # Empty update
+        ]
 
-            # Test face retrieval
+        for i, update_data in enumerate(update_scenarios):
             try:
-                face_data = clasificador.get_face(test_face_id)
-                print(f"✅ Face retrieval: {face_data is not None}")
+                result = clasificador.update_face(test_face_id, **update_data)
+                print(f"✅ Face update {i}: {result}")
             except Exception as e:
-                print(f"✅ Face retrieval handled: {type(e).__name__}")
+                print(f"✅ Face update {i} handled: {type(e).__name__}")
 
-        except ImportError:
-            pytest.skip("Face management not available")
+        # Test face retrieval
+        try:
+            face_data = clasificador.get_face(test_face_id)
+            print(f"✅ Face retrieval: {face_data is not None}")
+        except Exception as e:
+            print(f"✅ Face retrieval handled: {type(e).__name__}")
 
 
 @pytest.mark.integration
@@ -828,12 +777,11 @@ class TestAppCoverageTargeted:
                 for i, request_data in enumerate(test_requests):
                     response = client.post(
                         "/face-rekon/recognize",
-                        data=json.dumps(request_data),
-                        content_type="application/json",
+                        json=request_data,
                     )
                     print(f"✅ Recognize request {i}: {response.status_code}")
                     if response.status_code == 200:
-                        data = json.loads(response.data)
+                        data = response.get_json()
                         assert "faces" in data or "status" in data
 
         except ImportError:
@@ -845,7 +793,7 @@ class TestAppCoverageTargeted:
             import app
 
             with app.app.test_client() as client:
-                # Test various pagination scenarios
+                # Pagination query variants for the unclassified faces listing
                 pagination_urls = [
                     "/face-rekon/?page=1&per_page=5",
                     "/face-rekon/?page=2&per_page=10",
@@ -860,6 +808,7 @@ class TestAppCoverageTargeted:
                     "/face-rekon/?extra_param=value&page=1&per_page=5",  # Extra params
                 ]
 
+                # Test various pagination scenarios
                 for url in pagination_urls:
                     response = client.get(url)
                     print(f"✅ Pagination {url}: {response.status_code}")
@@ -867,56 +816,28 @@ class TestAppCoverageTargeted:
         except ImportError:
             pytest.skip("Flask app not available")
 
-    def test_face_operations_comprehensive_coverage(self):
-        """Test face operations to cover more app.py routes"""
-        try:
-            import uuid
-
-            import app
-
-            with app.app.test_client() as client:
-                # Test GET face with different scenarios
-                face_ids_to_test = [
-                    "existing_face_id",
-                    "non_existent_face_id",
-                    str(uuid.uuid4()),
-                    "face_with_special_chars_123!@#",
-                    "",  # Empty face ID
-                    "a" * 100,  # Very long face ID
-                ]
-
-                for face_id in face_ids_to_test:
-                    # Test GET
-                    response = client.get(f"/face-rekon/{face_id}")
-                    print(f"✅ GET face '{face_id[:20]}...': {response.status_code}")
-
-                    # Test PATCH with different update data
-                    update_scenarios = [
-                        {"name": "Test Person"},
-                        {"name": "Another Person", "relationship": "friend"},
-                        {"relationship": "family"},
-                        {"tags": ["tag1", "tag2"]},
-                        {"name": "", "relationship": ""},  # Empty values
-                        {},  # Empty update
-                        {"invalid_field": "should_be_ignored"},  # Invalid field
-                        {"name": "Person with Unicode: 😀🎉"},  # Unicode
-                    ]
-
-                    for j, update_data in enumerate(
-                        update_scenarios[:3]
-                    ):  # Limit to avoid too many tests
-                        response = client.patch(
-                            f"/face-rekon/{face_id}",
-                            data=json.dumps(update_data),
-                            content_type="application/json",
-                        )
-                        print(
-                            f"✅ PATCH face '{face_id[:10]}...' "
-                            f"scenario {j}: {response.status_code}"
-                        )
-
-        except ImportError:
-            pytest.skip("Flask app not available")
+    @pytest.mark.parametrize("face_id", _EDGE_FACE_IDS, ids=_EDGE_FACE_ID_NAMES)
+    def test_edge_case_face_get(self, client, face_id):
+        """Test GET face with edge-case face ids"""
+        response = client.get(f"/face-rekon/{face_id}")
+        print(f"✅ GET face '{face_id[:20]}...': {response.status_code}")
+
+    @pytest.mark.parametrize("face_id", _EDGE_FACE_IDS, ids=_EDGE_FACE_ID_NAMES)
+    def test_edge_case_face_patch(self, client, face_id):
+        """Test PATCH face with edge-case face ids"""
+        # PATCH payloads sent per face id
+        update_scenarios = [
+            {"name": "Test Person"},
+            {"name": "Another Person", "relationship": "friend"},
+            {"relationship": "family"},
+        ]
+
+        for j, update_data in enumerate(update_scenarios):
+            response = client.patch(f"/face-rekon/{face_id}", json=update_data)
+            print(
+                f"✅ PATCH face '{face_id[:10]}...' "
+                f"scenario {j}: {response.status_code}"
+            )
 
     def test_static_file_serving_comprehensive(self):
         """Test static file serving to cover more app.py static routes"""
@@ -924,7 +845,7 @@ class TestAppCoverageTargeted:
             import app
 
             with app.app.test_client() as client:
-                # Test various static files and paths
+                # Static paths including missing files, directories and traversal
                 static_paths = [
                     "/face-rekon/ui/css/styles.css",
                     "/face-rekon/ui/js/main.js",
@@ -938,6 +859,7 @@ class TestAppCoverageTargeted:
                     "/face-rekon/ui/css/../js/main.js",  # Relative path
                 ]
 
+                # Test various static files and paths
                 for path in static_paths:
                     response = client.get(path)
                     print(f"✅ Static file {path}: {response.status_code}")
@@ -951,7 +873,7 @@ class TestAppCoverageTargeted:
             import app
 
             with app.app.test_client() as client:
-                # Test various error scenarios
+                # (endpoint, content type, raw body) triples for malformed requests
                 error_test_cases = [
                     # Invalid content types
                     ("/face-rekon/recognize", "text/plain", "not json"),
@@ -979,19 +901,21 @@ class TestAppCoverageTargeted:
                     ("/face-rekon/load-snapshot", "application/json", "{}"),
                 ]
 
+                # Test various error scenarios
                 for endpoint, content_type, data in error_test_cases:
                     response = client.post(
                         endpoint, data=data, content_type=content_type
                     )
                     print(f"✅ Error test {endpoint}: {response.status_code}")
 
-                # Test HTTP methods not allowed
+                # (method, endpoint) pairs that must be rejected
                 not_allowed_tests = [
                     ("DELETE", "/face-rekon/ping"),
                     ("PUT", "/face-rekon/recognize"),
                     ("DELETE", "/face-rekon/"),
                 ]
 
+                # Test HTTP methods not allowed
                 for method, endpoint in not_allowed_tests:
                     response = client.open(method=method, path=endpoint)
                     print(f"✅ Method {method} {endpoint}: {response.status_code}")
@@ -4,13 +4,11 @@ Targets 80% coverage of app.py lines 73-239 (Recognize.post method).
 Tests all critical paths: validation, processing, error handling, response assembly.
 """
 import base64
-import io
 import os
 import sys
 from unittest.mock import Mock, patch
 
 import pytest
-from PIL import Image, ImageDraw
 
 from .test_recognize_mocks import (
     RecognizeAssertions,
@@ -41,76 +39,8 @@ with patch.dict(
         import app
 
 
-@pytest.fixture
-def test_image_base64():
-    """Create a realistic test image for face detection"""
-    img = Image.new("RGB", (640, 480), color=(240, 240, 240))
-    draw = ImageDraw.Draw(img)
-
-    # Create a realistic face pattern
-    center = (320, 240)
-    width, height = 160, 200
-
-    # Face oval
-    face_bbox = [
-        center[0] - width // 2,
-        center[1] - height // 2,
-        center[0] + width // 2,
-        center[1] + height // 2,
-    ]
-    draw.ellipse(face_bbox, fill=(255, 220, 177), outline=(200, 160, 120), width=2)
-
-    # Eyes
-    left_eye = (center[0] - 30, center[1] - 40)
-    right_eye = (center[0] + 30, center[1] - 40)
-
-    for eye_center in [left_eye, right_eye]:
-        draw.ellipse(
-            [
-                eye_center[0] - 15,
-                eye_center[1] - 10,
-                eye_center[0] + 15,
-                eye_center[1] + 10,
-            ],
-            fill="white",
-            outline="black",
-            width=2,
-        )
-        draw.ellipse(
-            [
-                eye_center[0] - 6,
-                eye_center[1] - 6,
-                eye_center[0] + 6,
-                eye_center[1] + 6,
-            ],
-            fill="black",
-        )
-
-    # Nose
-    draw.polygon(
-        [
-            (center[0], center[1]),
-            (center[0] - 10, center[1] + 20),
-            (center[0] + 10, center[1] + 20),
-        ],
-        fill=(210, 180, 140),
-    )
-
-    # Mouth
-    draw.arc(
-        [center[0] - 30, center[1] + 50, center[0] + 30, center[1] + 80],
-        start=0,
-        end=180,
-        fill="red",
-        width=3,
-    )
-
-    buffered = io.BytesIO()
-    img.save(buffered, format="JPEG", quality=95)
-    return base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="ml_models")
 class TestRecognizeEndpointCoverage:
     """Comprehensive tests targeting specific coverage gaps in /recognize endpoint"""
 
@@ -141,10 +71,10 @@ class TestRecognizeEndpointCoverage:
             print("✅ No JSON data test passed")
 
     # Test Cases 4-5: Base64 processing (lines 91-100)
-    def test_recognize_data_uri_format(self, test_image_base64):
+    def test_recognize_data_uri_format(self, encoded_test_png):
         """Test /recognize endpoint with data URI format (lines 91-95)"""
         with app.app.test_client() as client:
-            data_uri_image = RecognizeTestData.create_data_uri_image(test_image_base64)
+            data_uri_image = encoded_test_png["png_data_uri_jpeg"]
             response = RecognizeTestUtils.make_recognize_request(
                 client,
                 {"image_base64": data_uri_image, "event_id": "test_data_uri"},
@@ -213,12 +143,13 @@ class TestRecognizeEndpointCoverage:
                 print(f"✅ {format_name.upper()} format detection test passed")
 
     # Test Case 11: Missing event_id Flask-RESTX validation
-    def test_recognize_missing_event_id(self, test_image_base64):
+    def test_recognize_missing_event_id(self):
         """Test /recognize endpoint with missing event_id (Flask-RESTX validation)"""
         with app.app.test_client() as client:
-            # This should trigger Flask-RESTX validation error
+            # This should trigger Flask-RESTX validation error. The schema
+            # rejects the request before base64 decoding, so any string works
             response = RecognizeTestUtils.make_recognize_request(
-                client, {"image_base64": test_image_base64}
+                client, {"image_base64": "AAAAAAAA"}
             )
             # Expect Flask-RESTX validation error (400)
             assert response.status_code == 400
@@ -358,62 +289,41 @@ class TestRecognizeEndpointCoverage:
             # Should exercise storage logic paths (lines 175-206)
             print("✅ Storage logic coverage test passed")
 
-    # Test Case 21: Optimized storage path (lines 183-192)
-    def test_recognize_optimized_storage_path(self, test_image_base64):
-        """Test /recognize with optimized storage enabled (lines 183-192)"""
-        with app.app.test_client() as client:
-            # Ensure optimized storage is enabled
-            original_storage = app.clasificador.USE_OPTIMIZED_STORAGE
-            try:
-                app.clasificador.USE_OPTIMIZED_STORAGE = True
-
-                response = RecognizeTestUtils.make_recognize_request(
-                    client,
-                    {
-                        "image_base64": test_image_base64,
-                        "event_id": "test_optimized_storage",
-                    },
-                )
-
-                # Should process successfully (may or may not find faces)
-                assert response.status_code == 200
-                data = response.get_json()
-                assert "status" in data
-                print("✅ Optimized storage path test passed")
-            finally:
-                app.clasificador.USE_OPTIMIZED_STORAGE = original_storage
-
-    # Test Case 22: Legacy storage path (lines 197-205)
-    def test_recognize_legacy_storage_path(self, test_image_base64):
-        """Test /recognize with legacy storage (lines 197-205)"""
+    # Test Cases 21, 22, 25: Optimized, legacy and suggestion storage paths
+    @pytest.mark.parametrize(
+        "use_optimized,event_id",
+        [
+            pytest.param(True, "test_optimized_storage", id="optimized"),
+            pytest.param(False, "test_legacy_storage", id="legacy"),
+            pytest.param(True, "test_suggestion_storage", id="suggestion"),
+        ],
+    )
+    def test_recognize_storage_paths(self, test_image_base64, use_optimized, event_id):
+        """Test /recognize storage branches (lines 183-192, 197-205)"""
         with app.app.test_client() as client:
-            # Ensure legacy storage is used
             original_storage = app.clasificador.USE_OPTIMIZED_STORAGE
             try:
-                app.clasificador.USE_OPTIMIZED_STORAGE = False
+                app.clasificador.USE_OPTIMIZED_STORAGE = use_optimized
 
                 response = RecognizeTestUtils.make_recognize_request(
                     client,
-                    {
-                        "image_base64": test_image_base64,
-                        "event_id": "test_legacy_storage",
-                    },
+                    {"image_base64": test_image_base64, "event_id": event_id},
                 )
 
                 # Should process successfully (may or may not find faces)
                 assert response.status_code == 200
                 data = response.get_json()
                 assert "status" in data
-                print("✅ Legacy storage path test passed")
+                print(f"✅ Storage path test passed ({event_id})")
             finally:
                 app.clasificador.USE_OPTIMIZED_STORAGE = original_storage
 
     # Test Case 23: Custom data prefix edge case (lines 97, 100)
-    def test_recognize_custom_semicolon_data_prefix(self, test_image_base64):
+    def test_recognize_custom_semicolon_data_prefix(self, encoded_test_png):
         """Test /recognize with semicolon data prefix format (lines 97, 100)"""
         with app.app.test_client() as client:
-            # Create image with ;data: prefix (not data:)
-            custom_image = f"image/jpg;data:{test_image_base64}"
+            # Image with ;data: prefix (not data:), precomputed per session
+            custom_image = encoded_test_png["png_semicolon_prefix"]
 
             response = RecognizeTestUtils.make_recognize_request(
                 client,
@@ -447,33 +357,6 @@ class TestRecognizeEndpointCoverage:
             assert response.status_code in [200, 400, 500]
             print("✅ JSON decode exception handling test passed")
 
-    # Test Case 25: Suggestion status storage path (lines 183-192)
-    def test_recognize_suggestion_face_storage(self, test_image_base64):
-        """Test /recognize with suggestion faces (lines 183-192)"""
-        with app.app.test_client() as client:
-            # This test relies on real face detection possibly returning suggestions
-            # Ensure optimized storage is enabled
-            original_storage = app.clasificador.USE_OPTIMIZED_STORAGE
-            try:
-                app.clasificador.USE_OPTIMIZED_STORAGE = True
-
-                response = RecognizeTestUtils.make_recognize_request(
-                    client,
-                    {
-                        "image_base64": test_image_base64,
-                        "event_id": "test_suggestion_storage",
-                    },
-                )
-
-                # Should process successfully
-                assert response.status_code == 200
-                data = response.get_json()
-                assert "status" in data
-                # Tests the storage path code even if no suggestions returned
-                print("✅ Suggestion face storage test passed")
-            finally:
-                app.clasificador.USE_OPTIMIZED_STORAGE = original_storage
-
     # Test Case 26: Lines 78-79 validation error path
     def test_recognize_validation_error_logging(self):
         """Test /recognize validation error logging (lines 78-79)"""
@@ -488,70 +371,40 @@ class TestRecognizeEndpointCoverage:
             assert response.status_code == 400
             print("✅ Validation error logging test passed")
 
-    # Test Case 27: Real face with optimized storage (lines 183-192)
-    def test_recognize_real_face_optimized_storage(self):
-        """Test /recognize with real face image to trigger storage (lines 183-192)"""
-        with app.app.test_client() as client:
-            # Use real test image with a face
-            import base64
-
-            with open("tests/dummies/one-face.jpg", "rb") as f:
-                image_data = f.read()
-                image_base64 = base64.b64encode(image_data).decode()
-
-            original_storage = app.clasificador.USE_OPTIMIZED_STORAGE
-            try:
-                app.clasificador.USE_OPTIMIZED_STORAGE = True
-
-                response = RecognizeTestUtils.make_recognize_request(
-                    client,
-                    {
-                        "image_base64": image_base64,
-                        "event_id": "test_real_face_optimized",
-                    },
-                )
-
-                assert response.status_code == 200
-                data = response.get_json()
-                # Real face should be detected
-                assert "faces_count" in data
-                print("✅ Real face with optimized storage test passed")
-            finally:
-                app.clasificador.USE_OPTIMIZED_STORAGE = original_storage
-
-    # Test Case 28: Real face with legacy storage (lines 197-205)
-    def test_recognize_real_face_legacy_storage(self):
-        """Test /recognize with real face image and legacy storage (lines 197-205)"""
+    # Test Cases 27-28: Real face with optimized and legacy storage
+    @pytest.mark.parametrize(
+        "use_optimized,event_id",
+        [
+            pytest.param(True, "test_real_face_optimized", id="optimized"),
+            pytest.param(False, "test_real_face_legacy", id="legacy"),
+        ],
+    )
+    def test_recognize_real_face_storage(self, use_optimized, event_id):
+        """Test /recognize with a real face to trigger storage (lines 183-205)"""
         with app.app.test_client() as client:
             # Use real test image with a face
-            import base64
-
             with open("tests/dummies/one-face.jpg", "rb") as f:
-                image_data = f.read()
-                image_base64 = base64.b64encode(image_data).decode()
+                image_base64 = base64.b64encode(f.read()).decode()
 
             original_storage = app.clasificador.USE_OPTIMIZED_STORAGE
             try:
-                app.clasificador.USE_OPTIMIZED_STORAGE = False
+                app.clasificador.USE_OPTIMIZED_STORAGE = use_optimized
 
                 response = RecognizeTestUtils.make_recognize_request(
                     client,
-                    {
-                        "image_base64": image_base64,
-                        "event_id": "test_real_face_legacy",
-                    },
+                    {"image_base64": image_base64, "event_id": event_id},
                 )
 
                 assert response.status_code == 200
                 data = response.get_json()
                 # Real face should be detected
                 assert "faces_count" in data
-                print("✅ Real face with legacy storage test passed")
+                print(f"✅ Real face storage test passed ({event_id})")
             finally:
                 app.clasificador.USE_OPTIMIZED_STORAGE = original_storage
 
     # Test Case 29: Main exception handler (lines 223-234)
-    def test_recognize_main_exception_handler(self, test_image_base64):
+    def test_recognize_main_exception_handler(self, tiny_image_b64):
         """Test /recognize main exception handling (lines 223-234)"""
         import app
 
@@ -566,7 +419,7 @@ class TestRecognizeEndpointCoverage:
                 response = RecognizeTestUtils.make_recognize_request(
                     client,
                     {
-                        "image_base64": test_image_base64,
+                        "image_base64": tiny_image_b64,
                         "event_id": "test_main_exception",
                     },
                 )
@@ -4,11 +4,16 @@ Contains reusable test data generators, mock responses, and assertion helpers.
 """
 import base64
 import io
-import json
 import os
 
+import orjson
 from PIL import Image, ImageDraw
 
+SUCCESS_RESPONSE_KEYS = frozenset(
+    {"status", "faces_count", "faces", "event_id", "processing_method"}
+)
+ERROR_RESPONSE_KEYS = frozenset({"error", "event_id", "status", "faces_count", "faces"})
+
 
 class RecognizeTestData:
     """Test data generator for /recognize endpoint tests"""
@@ -17,8 +22,7 @@ class RecognizeTestData:
     def create_mock_json_error_response():
         """Create JSON error response disguised as image data (for lines 108-125)"""
         error_response = {"success": False, "message": "Camera error"}
-        json_str = json.dumps(error_response)
-        return base64.b64encode(json_str.encode()).decode()
+        return base64.b64encode(orjson.dumps(error_response)).decode()
 
     @staticmethod
     def create_data_uri_image(base64_image):
@@ -69,7 +73,7 @@ class RecognizeTestData:
         draw.ellipse([400, 300, 600, 450], fill=(255, 220, 177))
 
         buffered = io.BytesIO()
-        img.save(buffered, format="JPEG", quality=85)
+        img.save(buffered, format="JPEG", quality=75, optimize=False)
         return base64.b64encode(buffered.getvalue()).decode()
 
     @staticmethod
@@ -133,14 +137,13 @@ class RecognizeTestScenarios:
 
     @staticmethod
     def get_error_scenarios():
-        """Get error handling test scenarios"""
+        """Get error handling test scenarios
+
+        Invalid base64, JSON error responses and large payloads each have a
+        dedicated test; this keeps the one case they don't: valid base64
+        that is not a decodable image.
+        """
         return [
-            ("invalid_base64", RecognizeTestData.create_invalid_base64()),
-            (
-                "json_error_response",
-                RecognizeTestData.create_mock_json_error_response(),
-            ),
-            ("large_payload", RecognizeTestData.create_large_payload()),
             ("corrupted_data", RecognizeTestData.create_corrupted_jpeg_data()),
         ]
 
@@ -185,11 +188,7 @@ class RecognizeAssertions:
         """Assert successful response structure (lines 208-219)"""
         if response.status_code == 200:
             data = response.get_json()
-            assert "status" in data
-            assert "faces_count" in data
-            assert "faces" in data
-            assert "event_id" in data
-            assert "processing_method" in data
+            assert SUCCESS_RESPONSE_KEYS <= data.keys()
             assert data["processing_method"] == "face_extraction_crops"
 
     @staticmethod
@@ -197,12 +196,8 @@ class RecognizeAssertions:
         """Assert error response has proper structure (lines 224-232)"""
         if response.status_code == 500:
             data = response.get_json()
-            assert "error" in data
-            assert "event_id" in data
-            assert "status" in data
+            assert ERROR_RESPONSE_KEYS <= data.keys()
             assert data["status"] == "error"
-            assert "faces_count" in data
-            assert "faces" in data
 
     @staticmethod
     def assert_processing_response(response):
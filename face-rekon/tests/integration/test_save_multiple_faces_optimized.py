@@ -10,11 +10,18 @@ Tests the complete face saving pipeline with real ML stack:
 These tests run in Docker with full ML dependencies (InsightFace, OpenCV, Qdrant).
 """
 
+import itertools
 import os
-import uuid
 
 import pytest
 
+_eid_counter = itertools.count()
+
+
+def _eid(prefix):
+    """Event id unique within this run; no UUID format is needed for events."""
+    return f"{prefix}_{next(_eid_counter)}_{os.getpid()}"
+
 
 class TestSaveMultipleFacesOptimized:
     """Test save_multiple_faces_optimized() with real face images."""
@@ -32,7 +39,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.clasificador import save_multiple_faces_optimized
 
             image_path = os.path.join(test_images_dir, "one-face.jpg")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # Save faces
             saved_ids = save_multiple_faces_optimized(image_path, event_id)
@@ -53,7 +60,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.clasificador import save_multiple_faces_optimized
 
             image_path = os.path.join(test_images_dir, "two-faces.jpg")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # Save faces
             saved_ids = save_multiple_faces_optimized(image_path, event_id)
@@ -76,7 +83,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.clasificador import save_multiple_faces_optimized
 
             image_path = os.path.join(test_images_dir, "twelve-faces.png")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # Save faces
             saved_ids = save_multiple_faces_optimized(image_path, event_id)
@@ -97,7 +104,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.clasificador import save_multiple_faces_optimized
 
             image_path = os.path.join(test_images_dir, "zero-faces.jpg")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # Save faces (should return empty list)
             saved_ids = save_multiple_faces_optimized(image_path, event_id)
@@ -119,7 +126,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.clasificador import save_multiple_faces_optimized
 
             image_path = os.path.join(test_images_dir, "one-face.jpg")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # First save - should succeed
             saved_ids_1 = save_multiple_faces_optimized(image_path, event_id)
@@ -141,7 +148,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.clasificador import save_multiple_faces_optimized
 
             invalid_path = "/nonexistent/path/to/image.jpg"
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # Should handle error gracefully and return empty list
             saved_ids = save_multiple_faces_optimized(invalid_path, event_id)
@@ -159,7 +166,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.qdrant_adapter import db_get_face
 
             image_path = os.path.join(test_images_dir, "one-face.jpg")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # Save face
             saved_ids = save_multiple_faces_optimized(image_path, event_id)
@@ -195,7 +202,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.qdrant_adapter import db_get_face
 
             image_path = os.path.join(test_images_dir, "two-faces.jpg")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # Save faces
             saved_ids = save_multiple_faces_optimized(image_path, event_id)
@@ -222,7 +229,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.qdrant_adapter import db_get_face
 
             image_path = os.path.join(test_images_dir, "one-face.jpg")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             before_timestamp = int(time.time() * 1000)
 
@@ -255,7 +262,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.qdrant_adapter import db_get_face
 
             image_path = os.path.join(test_images_dir, "one-face.jpg")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # Save face
             saved_ids = save_multiple_faces_optimized(image_path, event_id)
@@ -281,7 +288,7 @@ class TestSaveMultipleFacesOptimized:
             from scripts.qdrant_adapter import db_get_face
 
             image_path = os.path.join(test_images_dir, "one-face.jpg")
-            event_id = f"test-event-{uuid.uuid4()}"
+            event_id = _eid("test-event")
 
             # Save face
             saved_ids = save_multiple_faces_optimized(image_path, event_id)
@@ -7,11 +7,19 @@ from dummy test images in Docker environment.
 """
 
 import base64
+import functools
 
 import numpy as np
 import pytest
 
 
+@functools.lru_cache(maxsize=None)
+def _dummy_b64(img_file):
+    """Base64 of a tests/dummies image, read and encoded once per process."""
+    with open(f"tests/dummies/{img_file}", "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
+
 @pytest.fixture
 def qdrant_adapter_with_real_faces(qdrant_adapter):
     """
@@ -22,20 +30,17 @@ def qdrant_adapter_with_real_faces(qdrant_adapter):
         import scripts.clasificador as clasificador
 
         # Store the face embeddings for later use in tests
-        saved_faces = []
+        pending = []
 
         # Load real test images and extract embeddings
         test_images = ["one-face.jpg", "two-faces.jpg"]
 
         for img_file in test_images:
-            with open(f"tests/dummies/{img_file}", "rb") as f:
-                image_data = f.read()
-                image_base64 = base64.b64encode(image_data).decode()
+            image_base64 = _dummy_b64(img_file)
 
             # Extract face embeddings using real ML pipeline
             faces = clasificador.extract_faces_with_crops(image_base64)
 
-            # Save faces to Qdrant
             for i, face in enumerate(faces):
                 face_data = {
                     "face_id": f"test_{img_file}_{i}",
@@ -45,9 +50,14 @@ def qdrant_adapter_with_real_faces(qdrant_adapter):
                 }
                 # Get embedding using real face detection
                 embedding = clasificador.get_embedding(face["image"])
-                face_id = qdrant_adapter.save_face(face_data, embedding)
-                saved_faces.append({"face_id": face_id, "embedding": embedding})
-                print(f"✅ Saved face: {face_id} from {img_file}")
+                pending.append((face_data, embedding))
+
+        # Save all faces to Qdrant in a single upsert
+        face_ids = qdrant_adapter.save_faces(pending)
+        saved_faces = [
+            {"face_id": face_id, "embedding": embedding}
+            for face_id, (_, embedding) in zip(face_ids, pending)
+        ]
 
         print(f"✅ Total faces saved in fixture: {len(saved_faces)}")
 
@@ -75,9 +85,7 @@ class TestSearchSimilarFaces:
             adapter = qdrant_adapter
 
             # Load and save a face first
-            with open("tests/dummies/one-face.jpg", "rb") as f:
-                image_data = f.read()
-                image_base64 = base64.b64encode(image_data).decode()
+            image_base64 = _dummy_b64("one-face.jpg")
 
             faces = clasificador.extract_faces_with_crops(image_base64)
             if len(faces) > 0:
@@ -91,11 +99,8 @@ class TestSearchSimilarFaces:
                 saved_id = adapter.save_face(face_data, embedding)
                 print(f"✅ Saved face with ID: {saved_id}")
 
-                # Verify the face was saved
-                import time
-
-                time.sleep(0.1)  # Small delay for Qdrant indexing
-
+                # Embedded Qdrant applies the upsert before returning, so the
+                # point is searchable straight away
                 # Now search with same embedding to guarantee match (213-218)
                 # Use very low threshold to get all results
                 results = adapter.search_similar_faces(
@@ -141,9 +146,7 @@ class TestSearchSimilarFaces:
             adapter = qdrant_adapter_with_real_faces
 
             # Get real face embedding
-            with open("tests/dummies/one-face.jpg", "rb") as f:
-                image_data = f.read()
-                image_base64 = base64.b64encode(image_data).decode()
+            image_base64 = _dummy_b64("one-face.jpg")
 
             faces = clasificador.extract_faces_with_crops(image_base64)
             if len(faces) > 0:
@@ -177,9 +180,7 @@ class TestSearchSimilarFaces:
             adapter = qdrant_adapter_with_real_faces
 
             # Get real face embedding
-            with open("tests/dummies/two-faces.jpg", "rb") as f:
-                image_data = f.read()
-                image_base64 = base64.b64encode(image_data).decode()
+            image_base64 = _dummy_b64("two-faces.jpg")
 
             faces = clasificador.extract_faces_with_crops(image_base64)
             if len(faces) > 0:
@@ -232,9 +233,7 @@ class TestSearchSimilarFaces:
             adapter = qdrant_adapter_with_real_faces
 
             # Get real face embedding
-            with open("tests/dummies/one-face.jpg", "rb") as f:
-                image_data = f.read()
-                image_base64 = base64.b64encode(image_data).decode()
+            image_base64 = _dummy_b64("one-face.jpg")
 
             faces = clasificador.extract_faces_with_crops(image_base64)
             if len(faces) > 0:
@@ -269,9 +268,7 @@ class TestSearchSimilarFaces:
             adapter = qdrant_adapter_with_real_faces
 
             # Get real face embedding
-            with open("tests/dummies/one-face.jpg", "rb") as f:
-                image_data = f.read()
-                image_base64 = base64.b64encode(image_data).decode()
+            image_base64 = _dummy_b64("one-face.jpg")
 
             faces = clasificador.extract_faces_with_crops(image_base64)
             if len(faces) > 0:
@@ -305,9 +302,7 @@ class TestSearchSimilarFaces:
             import scripts.clasificador as clasificador
 
             # Load real test image
-            with open("tests/dummies/one-face.jpg", "rb") as f:
-                image_data = f.read()
-                image_base64 = base64.b64encode(image_data).decode()
+            image_base64 = _dummy_b64("one-face.jpg")
 
             # Extract face and get embedding
             faces = clasificador.extract_faces_with_crops(image_base64)
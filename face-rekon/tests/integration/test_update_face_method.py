@@ -13,11 +13,20 @@ import numpy as np
 import pytest
 
 
+@pytest.fixture(scope="module")
+def unit_embeddings():
+    """Five L2-normalised 512-dim embeddings, generated and normalised as one batch"""
+    embeddings = np.random.default_rng(0).random((5, 512), dtype=np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings.setflags(write=False)
+    return embeddings
+
+
 @pytest.mark.integration
 class TestUpdateFaceMethodCoverage:
     """Comprehensive tests for update_face method to achieve 100% coverage"""
 
-    def test_update_face_success_path(self, qdrant_adapter):
+    def test_update_face_success_path(self, qdrant_adapter, unit_embeddings):
         """
         Test successful face update with real Qdrant operations.
         Covers lines: 271-284, 290-292, 294-296, 298-304
@@ -27,8 +36,7 @@ class TestUpdateFaceMethodCoverage:
 
             # Create a face to update
             face_id = str(uuid.uuid4())
-            embedding = np.random.rand(512).astype(np.float32)
-            embedding = embedding / np.linalg.norm(embedding)
+            embedding = unit_embeddings[0]
 
             face_data = {
                 "face_id": face_id,
@@ -110,7 +118,7 @@ class TestUpdateFaceMethodCoverage:
         except ImportError:
             pytest.skip("Qdrant adapter not available")
 
-    def test_update_face_multiple_fields(self, qdrant_adapter):
+    def test_update_face_multiple_fields(self, qdrant_adapter, unit_embeddings):
         """
         Test updating multiple fields at once.
         Additional coverage for lines: 294-296 (merge updates logic)
@@ -120,8 +128,7 @@ class TestUpdateFaceMethodCoverage:
 
             # Create a face with initial data
             face_id = str(uuid.uuid4())
-            embedding = np.random.rand(512).astype(np.float32)
-            embedding = embedding / np.linalg.norm(embedding)
+            embedding = unit_embeddings[1]
 
             face_data = {
                 "face_id": face_id,
@@ -162,7 +169,9 @@ class TestUpdateFaceMethodCoverage:
         except ImportError:
             pytest.skip("Qdrant adapter not available")
 
-    def test_update_face_preserves_existing_fields(self, qdrant_adapter):
+    def test_update_face_preserves_existing_fields(
+        self, qdrant_adapter, unit_embeddings
+    ):
         """
         Test that update_face preserves fields not included in updates.
         Covers lines: 290-296 (merge logic preserves existing data)
@@ -172,8 +181,7 @@ class TestUpdateFaceMethodCoverage:
 
             # Create a face with multiple fields (using fields save_face actually saves)
             face_id = str(uuid.uuid4())
-            embedding = np.random.rand(512).astype(np.float32)
-            embedding = embedding / np.linalg.norm(embedding)
+            embedding = unit_embeddings[2]
 
             face_data = {
                 "face_id": face_id,
@@ -208,7 +216,7 @@ class TestUpdateFaceMethodCoverage:
         except ImportError:
             pytest.skip("Qdrant adapter not available")
 
-    def test_update_face_timestamp_added(self, qdrant_adapter):
+    def test_update_face_timestamp_added(self, qdrant_adapter, unit_embeddings):
         """
         Test that update_face adds updated_at timestamp.
         Covers lines: 296 (timestamp addition)
@@ -218,8 +226,7 @@ class TestUpdateFaceMethodCoverage:
 
             # Create a face
             face_id = str(uuid.uuid4())
-            embedding = np.random.rand(512).astype(np.float32)
-            embedding = embedding / np.linalg.norm(embedding)
+            embedding = unit_embeddings[3]
 
             face_data = {
                 "face_id": face_id,
@@ -235,9 +242,6 @@ class TestUpdateFaceMethodCoverage:
             # Record time before update
             before_update = int(time.time())
 
-            # Small delay to ensure timestamp difference
-            time.sleep(0.1)
-
             # Update the face
             updates = {"name": "Test User"}
             result = adapter.update_face(face_id, updates)
@@ -254,7 +258,7 @@ class TestUpdateFaceMethodCoverage:
         except ImportError:
             pytest.skip("Qdrant adapter not available")
 
-    def test_update_face_empty_updates(self, qdrant_adapter):
+    def test_update_face_empty_updates(self, qdrant_adapter, unit_embeddings):
         """
         Test update_face with empty updates dictionary.
         Edge case: updates={} should still succeed and add timestamp.
@@ -264,8 +268,7 @@ class TestUpdateFaceMethodCoverage:
 
             # Create a face
             face_id = str(uuid.uuid4())
-            embedding = np.random.rand(512).astype(np.float32)
-            embedding = embedding / np.linalg.norm(embedding)
+            embedding = unit_embeddings[4]
 
             face_data = {
                 "face_id": face_id,
@@ -31,14 +31,12 @@ with patch.dict(
 class TestClasificadorFunctionality:
     """Test clasificador functionality without complex dependencies"""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_embeddings(self, dummy_embedding, dummy_embeddings):
         """Setup test data"""
-        # Create test embeddings
-        self.test_embedding = np.random.random(512).astype(np.float32)
-        self.test_embeddings = [
-            np.random.random(512).astype(np.float32),
-            np.random.random(512).astype(np.float32),
-        ]
+        # Reuse the session-scoped embeddings instead of regenerating per test
+        self.test_embedding = dummy_embedding
+        self.test_embeddings = list(dummy_embeddings)
 
     def test_multiple_face_embeddings_extraction(self):
         """Test extracting face crops with embeddings from multiple faces"""
@@ -278,7 +276,7 @@ class TestClasificadorFunctionality:
     def test_embedding_vector_operations(self):
         """Test embedding vector operations"""
         # Test that embeddings are proper numpy arrays
-        embedding = np.random.random(512).astype(np.float32)
+        embedding = self.test_embedding
 
         assert isinstance(embedding, np.ndarray)
         assert embedding.dtype == np.float32
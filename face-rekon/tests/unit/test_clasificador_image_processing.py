@@ -284,6 +284,29 @@ class TestSaveFaceCropToFile:
         except ImportError as e:
             pytest.skip(f"ML dependencies not available: {e}")
 
+    def test_save_face_crop_pil_fallback(self):
+        """Test thumbnails are encoded with PIL when PyTurboJPEG is missing."""
+        try:
+            import scripts.clasificador as clasificador
+
+            with tempfile.TemporaryDirectory() as tmpdir:
+                with patch("scripts.clasificador.THUMBNAIL_PATH", tmpdir), patch(
+                    "scripts.clasificador._turbo_jpeg", None
+                ):
+                    face_crop = np.zeros((200, 200, 3), dtype=np.uint8)
+                    face_id = "pil_fallback_face"
+
+                    thumbnail_path = clasificador.save_face_crop_to_file(
+                        face_crop, face_id
+                    )
+
+                    img = Image.open(thumbnail_path)
+                    assert img.format == "JPEG"
+                    assert img.size == (160, 160)
+
+        except ImportError as e:
+            pytest.skip(f"ML dependencies not available: {e}")
+
     def test_save_face_crop_error_handling(self):
         """Test error handling during file save."""
         try:
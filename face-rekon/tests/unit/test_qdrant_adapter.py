@@ -6,22 +6,37 @@ targeting remote server connection logic, error handling, and retry mechanisms.
 """
 
 import os
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 import pytest
 
 
+@pytest.fixture(scope="class")
+def _qdrant_patches():
+    """Install the embedded-mode environment and client patches once per class."""
+    with patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"}), patch(
+        "scripts.qdrant_adapter.QdrantClient"
+    ) as client_cls, patch("scripts.qdrant_adapter.os.makedirs") as makedirs:
+        yield SimpleNamespace(client_cls=client_cls, makedirs=makedirs)
+
+
+@pytest.fixture
+def qdrant_mocks(_qdrant_patches):
+    """Class-scoped patches with per-test configuration cleared."""
+    _qdrant_patches.client_cls.reset_mock(return_value=True, side_effect=True)
+    _qdrant_patches.makedirs.reset_mock()
+    return _qdrant_patches
+
+
 class TestQdrantAdapterEmbeddedMode:
     """Test suite for QdrantAdapter embedded mode error scenarios."""
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_embedded_storage_lock_conflict(self, mock_makedirs, mock_qdrant_client):
+    def test_embedded_storage_lock_conflict(self, qdrant_mocks):
         """Test handling of storage lock conflict error in embedded mode."""
         # Setup
-        mock_qdrant_client.side_effect = Exception(
+        qdrant_mocks.client_cls.side_effect = Exception(
             "Storage already accessed by another instance"
         )
 
@@ -32,13 +47,10 @@ class TestQdrantAdapterEmbeddedMode:
         with pytest.raises(Exception, match="already accessed by another instance"):
             QdrantAdapter()
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_embedded_generic_error(self, mock_makedirs, mock_qdrant_client):
+    def test_embedded_generic_error(self, qdrant_mocks):
         """Test handling of generic error in embedded mode."""
         # Setup
-        mock_qdrant_client.side_effect = Exception("Generic error")
+        qdrant_mocks.client_cls.side_effect = Exception("Generic error")
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -47,14 +59,27 @@ class TestQdrantAdapterEmbeddedMode:
         with pytest.raises(Exception, match="Generic error"):
             QdrantAdapter()
 
+    @patch("scripts.qdrant_adapter.QDRANT_PATH", ":memory:")
+    def test_memory_path_uses_in_memory_client(self, qdrant_mocks):
+        """Test QDRANT_PATH=":memory:" opens an in-memory client, no directory."""
+        mock_client_instance = MagicMock()
+        mock_client_instance.get_collections.return_value = Mock(
+            collections=[Mock(name="faces")]
+        )
+        qdrant_mocks.client_cls.return_value = mock_client_instance
+
+        from scripts.qdrant_adapter import QdrantAdapter
+
+        QdrantAdapter()
+
+        qdrant_mocks.client_cls.assert_called_once_with(location=":memory:")
+        qdrant_mocks.makedirs.assert_not_called()
+
 
 class TestQdrantAdapterCollectionManagement:
     """Test suite for collection creation and management error scenarios."""
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_collection_creation_failure(self, mock_makedirs, mock_qdrant_client):
+    def test_collection_creation_failure(self, qdrant_mocks):
         """Test error handling when collection creation fails."""
         # Setup
         mock_client_instance = MagicMock()
@@ -62,7 +87,7 @@ class TestQdrantAdapterCollectionManagement:
         mock_client_instance.create_collection.side_effect = Exception(
             "Collection creation failed"
         )
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -71,19 +96,14 @@ class TestQdrantAdapterCollectionManagement:
         with pytest.raises(Exception, match="Collection creation failed"):
             QdrantAdapter()
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_collection_get_collections_failure(
-        self, mock_makedirs, mock_qdrant_client
-    ):
+    def test_collection_get_collections_failure(self, qdrant_mocks):
         """Test error handling when get_collections fails."""
         # Setup
         mock_client_instance = MagicMock()
         mock_client_instance.get_collections.side_effect = Exception(
             "Failed to get collections"
         )
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -96,12 +116,7 @@ class TestQdrantAdapterCollectionManagement:
 class TestQdrantAdapterSearchOperations:
     """Test suite for search operation error handling."""
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_search_similar_faces_exception_handling(
-        self, mock_makedirs, mock_qdrant_client
-    ):
+    def test_search_similar_faces_exception_handling(self, qdrant_mocks):
         """Test search operation returns empty list on exception."""
         # Setup
         mock_client_instance = MagicMock()
@@ -109,7 +124,7 @@ class TestQdrantAdapterSearchOperations:
             collections=[Mock(name="faces")]
         )
         mock_client_instance.search.side_effect = Exception("Search failed")
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -126,10 +141,7 @@ class TestQdrantAdapterSearchOperations:
 class TestQdrantAdapterDeleteOperations:
     """Test suite for delete operation error handling."""
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_delete_face_not_found(self, mock_makedirs, mock_qdrant_client):
+    def test_delete_face_not_found(self, qdrant_mocks):
         """Test delete operation when face not found."""
         # Setup
         mock_client_instance = MagicMock()
@@ -137,7 +149,7 @@ class TestQdrantAdapterDeleteOperations:
             collections=[Mock(name="faces")]
         )
         mock_client_instance.scroll.return_value = ([], None)  # Empty results
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -149,10 +161,7 @@ class TestQdrantAdapterDeleteOperations:
         # Verify
         assert result is False
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_delete_face_exception_handling(self, mock_makedirs, mock_qdrant_client):
+    def test_delete_face_exception_handling(self, qdrant_mocks):
         """Test delete operation exception handling."""
         # Setup
         mock_client_instance = MagicMock()
@@ -160,7 +169,7 @@ class TestQdrantAdapterDeleteOperations:
             collections=[Mock(name="faces")]
         )
         mock_client_instance.scroll.side_effect = Exception("Delete failed")
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -176,10 +185,7 @@ class TestQdrantAdapterDeleteOperations:
 class TestQdrantAdapterGetFaceOperations:
     """Test suite for get_face operation error handling."""
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_get_face_not_found(self, mock_makedirs, mock_qdrant_client):
+    def test_get_face_not_found(self, qdrant_mocks):
         """Test get_face returns None when face not found."""
         # Setup
         mock_client_instance = MagicMock()
@@ -187,7 +193,7 @@ class TestQdrantAdapterGetFaceOperations:
             collections=[Mock(name="faces")]
         )
         mock_client_instance.scroll.return_value = ([], None)  # Empty results
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -199,10 +205,7 @@ class TestQdrantAdapterGetFaceOperations:
         # Verify
         assert result is None
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_get_face_exception_handling(self, mock_makedirs, mock_qdrant_client):
+    def test_get_face_exception_handling(self, qdrant_mocks):
         """Test get_face exception handling returns None."""
         # Setup
         mock_client_instance = MagicMock()
@@ -210,7 +213,7 @@ class TestQdrantAdapterGetFaceOperations:
             collections=[Mock(name="faces")]
         )
         mock_client_instance.scroll.side_effect = Exception("Get failed")
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -226,10 +229,7 @@ class TestQdrantAdapterGetFaceOperations:
 class TestQdrantAdapterUpdateOperations:
     """Test suite for update operation error handling."""
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_update_face_not_found(self, mock_makedirs, mock_qdrant_client):
+    def test_update_face_not_found(self, qdrant_mocks):
         """Test update operation when face not found."""
         # Setup
         mock_client_instance = MagicMock()
@@ -237,7 +237,7 @@ class TestQdrantAdapterUpdateOperations:
             collections=[Mock(name="faces")]
         )
         mock_client_instance.scroll.return_value = ([], None)  # Empty results
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -249,10 +249,7 @@ class TestQdrantAdapterUpdateOperations:
         # Verify
         assert result is False
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_update_face_exception_handling(self, mock_makedirs, mock_qdrant_client):
+    def test_update_face_exception_handling(self, qdrant_mocks):
         """Test update operation exception handling."""
         # Setup
         mock_client_instance = MagicMock()
@@ -260,7 +257,7 @@ class TestQdrantAdapterUpdateOperations:
             collections=[Mock(name="faces")]
         )
         mock_client_instance.scroll.side_effect = Exception("Update failed")
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -276,12 +273,7 @@ class TestQdrantAdapterUpdateOperations:
 class TestQdrantAdapterUnclassifiedFaces:
     """Test suite for get_unclassified_faces error handling."""
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_get_unclassified_faces_exception_handling(
-        self, mock_makedirs, mock_qdrant_client
-    ):
+    def test_get_unclassified_faces_exception_handling(self, qdrant_mocks):
         """Test get_unclassified_faces returns empty list on exception."""
         # Setup
         mock_client_instance = MagicMock()
@@ -289,7 +281,7 @@ class TestQdrantAdapterUnclassifiedFaces:
             collections=[Mock(name="faces")]
         )
         mock_client_instance.scroll.side_effect = Exception("Query failed")
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -313,18 +305,14 @@ class TestQdrantAdapterCheckRecentDetection:
         },
     )
     @patch("scripts.qdrant_adapter.DEDUPLICATION_WINDOW", 0)
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_check_recent_detection_disabled_window(
-        self, mock_makedirs, mock_qdrant_client
-    ):
+    def test_check_recent_detection_disabled_window(self, qdrant_mocks):
         """Test check_recent_detection returns False when deduplication disabled."""
         # Setup
         mock_client_instance = MagicMock()
         mock_client_instance.get_collections.return_value = Mock(
             collections=[Mock(name="faces")]
         )
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -335,22 +323,17 @@ class TestQdrantAdapterCheckRecentDetection:
 
         # Verify
         assert result is False
-        mock_client_instance.scroll.assert_not_called()
-
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_check_recent_detection_exception_handling(
-        self, mock_makedirs, mock_qdrant_client
-    ):
+        mock_client_instance.count.assert_not_called()
+
+    def test_check_recent_detection_exception_handling(self, qdrant_mocks):
         """Test check_recent_detection returns False on exception."""
         # Setup
         mock_client_instance = MagicMock()
         mock_client_instance.get_collections.return_value = Mock(
             collections=[Mock(name="faces")]
         )
-        mock_client_instance.scroll.side_effect = Exception("Query failed")
-        mock_qdrant_client.return_value = mock_client_instance
+        mock_client_instance.count.side_effect = Exception("Query failed")
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -362,14 +345,32 @@ class TestQdrantAdapterCheckRecentDetection:
         # Verify
         assert result is False
 
+    def test_check_recent_detection_uses_exact_count(self, qdrant_mocks):
+        """Test check_recent_detection asks Qdrant for an exact count."""
+        # Setup
+        mock_client_instance = MagicMock()
+        mock_client_instance.get_collections.return_value = Mock(
+            collections=[Mock(name="faces")]
+        )
+        mock_client_instance.count.return_value = Mock(count=0)
+        qdrant_mocks.client_cls.return_value = mock_client_instance
+
+        # Import after patching environment
+        from scripts.qdrant_adapter import QdrantAdapter
+
+        # Execute
+        adapter = QdrantAdapter()
+        result = adapter.check_recent_detection("test-event-123")
+
+        # Verify
+        assert result is False
+        assert mock_client_instance.count.call_args.kwargs["exact"] is True
+
 
 class TestQdrantAdapterGetStats:
     """Test suite for get_stats error handling."""
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_get_stats_exception_handling(self, mock_makedirs, mock_qdrant_client):
+    def test_get_stats_exception_handling(self, qdrant_mocks):
         """Test get_stats returns error status on exception."""
         # Setup
         mock_client_instance = MagicMock()
@@ -377,7 +378,7 @@ class TestQdrantAdapterGetStats:
             collections=[Mock(name="faces")]
         )
         mock_client_instance.get_collection.side_effect = Exception("Stats failed")
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -394,17 +395,14 @@ class TestQdrantAdapterGetStats:
 class TestQdrantAdapterSaveFaceEdgeCases:
     """Test suite for save_face edge cases and error handling."""
 
-    @patch.dict(os.environ, {"FACE_REKON_USE_EMBEDDED_QDRANT": "true"})
-    @patch("scripts.qdrant_adapter.QdrantClient")
-    @patch("scripts.qdrant_adapter.os.makedirs")
-    def test_save_face_invalid_uuid_conversion(self, mock_makedirs, mock_qdrant_client):
+    def test_save_face_invalid_uuid_conversion(self, qdrant_mocks):
         """Test save_face handles invalid UUID gracefully."""
         # Setup
         mock_client_instance = MagicMock()
         mock_client_instance.get_collections.return_value = Mock(
             collections=[Mock(name="faces")]
         )
-        mock_qdrant_client.return_value = mock_client_instance
+        qdrant_mocks.client_cls.return_value = mock_client_instance
 
         # Import after patching environment
         from scripts.qdrant_adapter import QdrantAdapter
@@ -422,3 +420,31 @@ class TestQdrantAdapterSaveFaceEdgeCases:
         # Verify - should generate new UUID instead of using invalid one
         assert face_id == "invalid-uuid-format"
         mock_client_instance.upsert.assert_called_once()
+
+    def test_save_faces_single_upsert(self, qdrant_mocks):
+        """Test save_faces writes every face with one upsert call."""
+        # Setup
+        mock_client_instance = MagicMock()
+        mock_client_instance.get_collections.return_value = Mock(
+            collections=[Mock(name="faces")]
+        )
+        qdrant_mocks.client_cls.return_value = mock_client_instance
+
+        # Import after patching environment
+        from scripts.qdrant_adapter import QdrantAdapter
+
+        # Execute
+        adapter = QdrantAdapter()
+        faces = [
+            ({"face_id": f"face_{i}", "name": "Test"}, np.zeros(512, np.float32))
+            for i in range(3)
+        ]
+
+        face_ids = adapter.save_faces(faces)
+
+        # Verify
+        assert face_ids == ["face_0", "face_1", "face_2"]
+        mock_client_instance.upsert.assert_called_once()
+        points = mock_client_instance.upsert.call_args.kwargs["points"]
+        assert len(points) == 3
+        assert adapter.save_faces([]) == []
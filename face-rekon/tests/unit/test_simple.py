@@ -81,11 +81,10 @@ class TestFaceRecognitionConcepts:
             is_match = distance < threshold
             assert is_match == expected_match
 
-    def test_embedding_vector_operations(self):
+    def test_embedding_vector_operations(self, dummy_embeddings):
         """Test operations on embedding vectors"""
         # Simulate face embeddings
-        embedding1 = np.random.random(512).astype(np.float32)
-        embedding2 = np.random.random(512).astype(np.float32)
+        embedding1, embedding2 = dummy_embeddings
 
         assert embedding1.shape == (512,)
         assert embedding2.shape == (512,)